@@ -19,6 +19,7 @@ from homeassistant.config_entries import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.loader import async_get_loaded_integration
 from homeassistant.setup import async_setup_component
 
 from .const import (
@@ -46,6 +47,7 @@ class QubeData:
     version: str
     multi_device: bool
     alarm_group_object_id: str | None = None
+    integration_version: str | None = None
     tariff_tracker: Any | None = None
     thermic_tariff_tracker: Any | None = None
     daily_tariff_tracker: Any | None = None
@@ -67,7 +69,7 @@ def _is_alarm_entity(ent: Any) -> bool:
     if ent.platform != "binary_sensor":
         return False
     vendor_id = (ent.vendor_id or "").lower()
-    name_lower = (ent.name or "").lower()
+    name_lower = ent.name_lower
     return (
         "alarm" in vendor_id
         or vendor_id.startswith("al_")
@@ -253,6 +255,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: QubeConfigEntry) -> bool
     if not version:
         version = "unknown"
 
+    # Resolve the integration version once for the diagnostic info sensor
+    integration_version: str | None = None
+    with contextlib.suppress(Exception):
+        integration = async_get_loaded_integration(hass, DOMAIN)
+        if integration.version:
+            integration_version = str(integration.version)
+
     async def _options_updated(hass: HomeAssistant, updated_entry: ConfigEntry) -> None:
         """Handle options update."""
         if updated_entry.entry_id != entry.entry_id:
@@ -276,6 +285,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: QubeConfigEntry) -> bool
         version=version,
         multi_device=multi_device,
         alarm_group_object_id=alarm_group_id,
+        integration_version=integration_version,
     )
 
     with contextlib.suppress(Exception):
@@ -9,7 +9,6 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_THERMOSTAT_ENABLED, DOMAIN
@@ -21,13 +20,13 @@ if TYPE_CHECKING:
     from . import QubeConfigEntry
     from .hub import EntityDef, QubeHub
 
-HIDDEN_VENDOR_IDS = {
+HIDDEN_VENDOR_IDS = frozenset({
     "dout_threewayvlv_val",
     "dout_fourwayvlv_val",
-}
+})
 
 # Vendor IDs that should be classified as problem/alarm sensors
-ALARM_VENDOR_IDS = {
+ALARM_VENDOR_IDS = frozenset({
     "al_maxtime_antileg_active",
     "al_maxtime_dhw_active",
     "al_dewpoint_active",
@@ -40,10 +39,10 @@ ALARM_VENDOR_IDS = {
     "srsalrm",
     "glbal",
     "alarmmng_al_pwrplus",
-}
+})
 
 # Vendor IDs that are running/power status sensors
-RUNNING_VENDOR_IDS = {
+RUNNING_VENDOR_IDS = frozenset({
     "dout_srcpmp_val",
     "dout_usrpmp_val",
     "dout_bufferpmp_val",
@@ -52,7 +51,7 @@ RUNNING_VENDOR_IDS = {
     "dout_heaterstep3_val",
     "dout_cooling_val",
     "keybonoff",
-}
+})
 
 
 def _derive_binary_device_class(
@@ -102,9 +101,7 @@ async def async_setup_entry(
 
     entities: list[BinarySensorEntity] = []
     alarm_entities: list[EntityDef] = []
-    for ent in hub.entities:
-        if ent.platform != "binary_sensor":
-            continue
+    for ent in hub.entities_by_platform.get("binary_sensor", ()):
         entities.append(
             QubeBinarySensor(coordinator, hub, show_label, multi_device, ent, version)
         )
@@ -150,11 +147,10 @@ class QubeBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._ent = ent
+        self._data_key = ent.data_key
         self._hub = hub
-        self._label = hub.label or "qube1"
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         if ent.translation_key:
             self._attr_translation_key = ent.translation_key
         else:
@@ -183,25 +179,10 @@ class QubeBinarySensor(CoordinatorEntity, BinarySensorEntity):
         if entity_category:
             self._attr_entity_category = entity_category
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return True if the binary sensor is on."""
-        key = (
-            self._ent.unique_id
-            or f"binary_sensor_{self._ent.input_type or self._ent.write_type}_{self._ent.address}"
-        )
-        val = self.coordinator.data.get(key)
+        val = self.coordinator.data.get(self._data_key)
         return None if val is None else bool(val)
 
 
@@ -228,6 +209,7 @@ class QubeAlarmStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._show_label = bool(show_label)
         self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._tied_entities = list(alarm_entities)
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_alarm_sensors_state"
@@ -235,18 +217,7 @@ class QubeAlarmStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self.entity_id = f"binary_sensor.{self._label}_alarm_sensors_active"
         self._attr_has_entity_name = True
         self._attr_icon = "mdi:alarm-light"
-        self._keys = [_entity_state_key(ent) for ent in alarm_entities]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+        self._keys = [ent.data_key for ent in alarm_entities]
 
     @property
     def is_on(self) -> bool:
@@ -263,21 +234,12 @@ def _is_alarm_entity(ent: EntityDef) -> bool:
     """Check if entity is an alarm."""
     if ent.platform != "binary_sensor":
         return False
-    name = (ent.name or "").lower()
-    if "alarm" in name:
+    if "alarm" in ent.name_lower:
         return True
     vendor = (ent.vendor_id or "").lower()
     return vendor.startswith("al")
 
 
-def _entity_state_key(ent: EntityDef) -> str:
-    """Generate state key for entity."""
-    if ent.unique_id:
-        return ent.unique_id
-    suffix = f"{ent.input_type or ent.write_type}_{ent.address}"
-    return f"binary_sensor_{suffix}"
-
-
 class QubeThermostatTimeoutSensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor indicating the thermostat temperature sensor has timed out."""
 
@@ -298,23 +260,13 @@ class QubeThermostatTimeoutSensor(CoordinatorEntity, BinarySensorEntity):
         self._hub = hub
         self._entry = entry
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._attr_translation_key = "thermostat_sensor_timeout"
         self._attr_unique_id = (
             f"{hub.host}_{hub.unit}_thermostat_sensor_timeout"
         )
         self.entity_id = f"binary_sensor.{hub.label}_thermostat_sensor_timeout"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def is_on(self) -> bool:
         """Return True if sensor has timed out."""
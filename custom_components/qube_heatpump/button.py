@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -68,6 +67,7 @@ class QubeReloadButton(CoordinatorEntity, ButtonEntity):
         self._entry_id = entry_id
         self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         label = hub.label or "qube1"
         self._show_label = bool(show_label)
         self._attr_translation_key = "qube_reload"
@@ -77,17 +77,6 @@ class QubeReloadButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_qube_reload"
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     async def async_press(self) -> None:
         """Handle the button press to reload the config entry."""
         await self.hass.config_entries.async_reload(self._entry_id)
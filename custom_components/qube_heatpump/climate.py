@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+from datetime import timedelta
 import logging
 import time
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -15,7 +16,6 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import (
     async_track_state_change_event,
     async_track_time_interval,
@@ -66,9 +66,7 @@ async def async_setup_entry(
     # Find the modbus_demand and bms_summerwinter switch EntityDefs
     demand_switch: EntityDef | None = None
     summer_switch: EntityDef | None = None
-    for ent in hub.entities:
-        if ent.platform != "switch":
-            continue
+    for ent in hub.entities_by_platform.get("switch", ()):
         if ent.vendor_id == "modbus_demand":
             demand_switch = ent
         elif ent.vendor_id == "bms_summerwinter":
@@ -132,6 +130,7 @@ class QubeVirtualThermostat(RestoreEntity, ClimateEntity):
         self._demand_switch = demand_switch
         self._summer_switch = summer_switch
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
 
         self._current_temp: float | None = None
         self._target_temp: float = 20.5
@@ -147,17 +146,6 @@ class QubeVirtualThermostat(RestoreEntity, ClimateEntity):
         self.entity_id = f"climate.{hub.label}_thermostat"
         self._attr_unique_id = f"{hub.host}_{hub.unit}_thermostat"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -230,8 +218,6 @@ class QubeVirtualThermostat(RestoreEntity, ClimateEntity):
         )
 
         # Periodic timeout check
-        from datetime import timedelta
-
         self._cancel_timeout_check = async_track_time_interval(
             self.hass,
             self._async_check_timeout,
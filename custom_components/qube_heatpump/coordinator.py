@@ -45,13 +45,6 @@ def _needs_monotonic_clamping(ent: EntityDef) -> bool:
     return bool(vendor.startswith("workinghours"))
 
 
-def _entity_key(ent: EntityDef) -> str:
-    """Generate a key for the coordinator data."""
-    if ent.unique_id:
-        return ent.unique_id
-    return f"{ent.platform}_{ent.input_type or ent.write_type}_{ent.address}"
-
-
 class QubeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Qube Heat Pump custom coordinator."""
 
@@ -178,7 +171,7 @@ class QubeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     warn_count += 1
                 continue
 
-            key = _entity_key(ent)
+            key = ent.data_key
             if isinstance(value, (int, float)) and not math.isfinite(float(value)):
                 if warn_count < warn_cap:
                     _LOGGER.warning(
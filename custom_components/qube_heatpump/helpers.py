@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 from typing import TYPE_CHECKING
 
@@ -9,12 +10,25 @@ if TYPE_CHECKING:
     from .hub import EntityDef
 
 
+# Maps every non-alphanumeric ASCII character to an underscore
+_ASCII_SLUG_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(128) if not chr(c).isalnum()}
+)
+
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """Make text safe for use as an entity ID component.
 
-    Converts text to lowercase alphanumeric with underscores.
+    Converts text to lowercase alphanumeric with underscores. Results are
+    cached since the same entity and vendor names are slugified repeatedly.
     """
-    return "".join(ch if ch.isalnum() else "_" for ch in str(text)).strip("_").lower()
+    text = str(text)
+    if text.isascii():
+        slug = text.translate(_ASCII_SLUG_TABLE)
+    else:
+        slug = "".join(ch if ch.isalnum() else "_" for ch in text)
+    return slug.strip("_").lower()
 
 
 def suggest_object_id(
@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from dataclasses import dataclass
+from functools import cached_property
 import ipaddress
 import logging
+import re
 import socket
 from typing import TYPE_CHECKING, Any
 
@@ -19,15 +21,16 @@ from python_qube_heatpump import (
 )
 from python_qube_heatpump.entities.base import InputType, Platform
 
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _slugify(text: str) -> str:
-    """Make text safe for use as an ID."""
-    return "".join(ch if ch.isalnum() else "_" for ch in str(text)).strip("_").lower()
+_LABEL_SEPARATORS = re.compile(r"[^a-z0-9]+")
 
 
 @dataclass
@@ -57,6 +60,18 @@ class EntityDef:
     # Reference to the library's entity definition
     _library_entity: LibraryEntityDef | None = None
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Return the lower-cased name, computed once per definition."""
+        return (self.name or "").lower()
+
+    @cached_property
+    def data_key(self) -> str:
+        """Return the coordinator data key for this definition."""
+        if self.unique_id:
+            return self.unique_id
+        return f"{self.platform}_{self.input_type or self.write_type}_{self.address}"
+
 
 def _derive_device_class(unit: str | None, key: str) -> str | None:
     """Derive Home Assistant device_class from unit of measurement."""
@@ -211,7 +226,12 @@ class QubeHub:
         self._unit = unit_id
         self._device_name = device_name or "Qube Heat Pump"
         self._client: QubeClient | None = None
-        self.entities: list[EntityDef] = []
+        self._entities: list[EntityDef] = []
+        self._by_platform: dict[str, list[EntityDef]] | None = None
+        self._platform_counts: dict[str, int] | None = None
+        self._by_address: dict[tuple[str, int], EntityDef] | None = None
+        self._by_unique_id: dict[str, EntityDef] | None = None
+        self._device_infos: dict[str, DeviceInfo] = {}
         # Error counters
         self._err_connect: int = 0
         self._err_read: int = 0
@@ -220,19 +240,21 @@ class QubeHub:
 
     def load_library_entities(self) -> None:
         """Load all entity definitions from the library."""
-        self.entities = []
+        entities: list[EntityDef] = []
 
         # Load binary sensors
         for lib_ent in BINARY_SENSORS.values():
-            self.entities.append(_library_to_ha_entity(lib_ent))
+            entities.append(_library_to_ha_entity(lib_ent))
 
         # Load sensors
         for lib_ent in SENSORS.values():
-            self.entities.append(_library_to_ha_entity(lib_ent))
+            entities.append(_library_to_ha_entity(lib_ent))
 
         # Load switches
         for lib_ent in SWITCHES.values():
-            self.entities.append(_library_to_ha_entity(lib_ent))
+            entities.append(_library_to_ha_entity(lib_ent))
+
+        self.entities = entities
 
         _LOGGER.debug(
             "Loaded %d entities from library (%d binary_sensor, %d sensor, %d switch)",
@@ -242,6 +264,73 @@ class QubeHub:
             len(SWITCHES),
         )
 
+    @property
+    def entities(self) -> list[EntityDef]:
+        """Return the loaded entity definitions."""
+        return self._entities
+
+    @entities.setter
+    def entities(self, entities: list[EntityDef]) -> None:
+        """Replace the entity definitions and drop derived caches."""
+        self._entities = entities
+        self._by_platform = None
+        self._platform_counts = None
+        self._by_address = None
+        self._by_unique_id = None
+
+    @property
+    def entities_by_platform(self) -> dict[str, list[EntityDef]]:
+        """Return the entity definitions grouped by platform, in load order."""
+        if self._by_platform is None:
+            by_platform: dict[str, list[EntityDef]] = {}
+            for ent in self._entities:
+                by_platform.setdefault(ent.platform, []).append(ent)
+            self._by_platform = by_platform
+        return self._by_platform
+
+    @property
+    def platform_counts(self) -> dict[str, int]:
+        """Return the number of entity definitions per platform."""
+        if self._platform_counts is None:
+            self._platform_counts = {
+                platform: len(ents)
+                for platform, ents in self.entities_by_platform.items()
+            }
+        return self._platform_counts
+
+    def get_entity_by_address(self, platform: str, address: int) -> EntityDef | None:
+        """Return the first entity definition for a platform and address."""
+        if self._by_address is None:
+            by_address: dict[tuple[str, int], EntityDef] = {}
+            for ent in self._entities:
+                by_address.setdefault((ent.platform, int(ent.address)), ent)
+            self._by_address = by_address
+        return self._by_address.get((platform, int(address)))
+
+    def get_entity_by_unique_id(self, unique_id: str) -> EntityDef | None:
+        """Return the first entity definition with the given unique_id."""
+        if self._by_unique_id is None:
+            by_unique_id: dict[str, EntityDef] = {}
+            for ent in self._entities:
+                if ent.unique_id:
+                    by_unique_id.setdefault(ent.unique_id, ent)
+            self._by_unique_id = by_unique_id
+        return self._by_unique_id.get(unique_id)
+
+    def get_device_info(self, sw_version: str) -> DeviceInfo:
+        """Return the DeviceInfo shared by all entities of this hub."""
+        info = self._device_infos.get(sw_version)
+        if info is None:
+            info = DeviceInfo(
+                identifiers={(DOMAIN, f"{self._host}:{self._unit}")},
+                name=self._device_name,
+                manufacturer="Qube",
+                model="Heat Pump",
+                sw_version=sw_version,
+            )
+            self._device_infos[sw_version] = info
+        return info
+
     def set_translations(self, translations: dict[str, Any]) -> None:
         """Set translations for friendly name resolution."""
         self._translations = translations
@@ -275,13 +364,11 @@ class QubeHub:
         """Return unit ID."""
         return self._unit
 
-    @property
+    @cached_property
     def label(self) -> str:
         """Return label derived from device name (for backwards compatibility)."""
-        # Slugify the device name to create a label
-        import re
-        slug = self._device_name.lower()
-        slug = re.sub(r"[^a-z0-9]+", "_", slug)
+        # Slugify the device name to create a label; the name is fixed per hub
+        slug = _LABEL_SEPARATORS.sub("_", self._device_name.lower())
         return slug.strip("_") or "qube"
 
     @property
@@ -347,8 +434,14 @@ class QubeHub:
             self._client = None
 
     def set_unit_id(self, unit_id: int) -> None:
-        """Set unit ID."""
+        """Set unit ID.
+
+        Existing entities keep the DeviceInfo they were created with; the
+        config entry must be reloaded for them to pick up the new unit.
+        """
         self._unit = int(unit_id)
+        # Only affects DeviceInfo handed out from now on
+        self._device_infos.clear()
         if self._client is not None:
             self._client.unit = self._unit
 
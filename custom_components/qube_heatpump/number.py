@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import EntityCategory, UnitOfTemperature
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -45,9 +44,7 @@ async def async_setup_entry(
     multi_device = data.multi_device
 
     entities: list[NumberEntity] = []
-    for ent in hub.entities:
-        if ent.platform != "sensor":
-            continue
+    for ent in hub.entities_by_platform.get("sensor", ()):
         if not ent.writable:
             continue
         # Only create number entities for temperature setpoints
@@ -90,11 +87,11 @@ class QubeSetpointNumber(CoordinatorEntity, NumberEntity):
         """Initialize the number entity."""
         super().__init__(coordinator)
         self._ent = ent
+        self._data_key = ent.data_key
         self._hub = hub
         self._label = hub.label or "qube1"
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
 
         # Set name from translation or entity name
         if ent.translation_key:
@@ -122,25 +119,10 @@ class QubeSetpointNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = DEFAULT_STEP
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        key = (
-            self._ent.unique_id
-            or f"sensor_{self._ent.input_type or self._ent.write_type}_{self._ent.address}"
-        )
-        val = self.coordinator.data.get(key)
+        val = self.coordinator.data.get(self._data_key)
         if val is None:
             return None
         try:
@@ -6,7 +6,6 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -69,9 +68,7 @@ async def async_setup_entry(
 
 
 def _find_switch(hub: QubeHub, vendor_id: str) -> EntityDef | None:
-    for ent in hub.entities:
-        if ent.platform != "switch":
-            continue
+    for ent in hub.entities_by_platform.get("switch", ()):
         if (ent.vendor_id or "").lower() == vendor_id.lower():
             return ent
     return None
@@ -99,13 +96,14 @@ class QubeSGReadyModeSelect(CoordinatorEntity, SelectEntity):
         super().__init__(coordinator)
         self._hub = hub
         self._version = str(version) if version else "unknown"
+        self._attr_device_info = hub.get_device_info(self._version)
         self._show_label = bool(show_label)
         self._multi_device = bool(multi_device)
         self._label = hub.label or "qube1"
         self._ent_a = sgready_a
         self._ent_b = sgready_b
-        self._key_a = self._entity_key(sgready_a)
-        self._key_b = self._entity_key(sgready_b)
+        self._key_a = sgready_a.data_key
+        self._key_b = sgready_b.data_key
         self._assumed_option = DEFAULT_OPTION
         self._entry_id = entry_id
 
@@ -114,17 +112,6 @@ class QubeSGReadyModeSelect(CoordinatorEntity, SelectEntity):
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_sgready_mode"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
@@ -167,10 +154,3 @@ class QubeSGReadyModeSelect(CoordinatorEntity, SelectEntity):
             return bool(value)
         except (ValueError, TypeError):
             return None
-
-    @staticmethod
-    def _entity_key(ent: EntityDef) -> str:
-        if ent.unique_id:
-            return ent.unique_id
-        suffix = f"{ent.input_type or ent.write_type}_{ent.address}"
-        return f"switch_{suffix}"
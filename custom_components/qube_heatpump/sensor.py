@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.components.sensor import (
@@ -13,9 +14,8 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.loader import async_get_integration, async_get_loaded_integration
 from homeassistant.util import dt as dt_util
 from python_qube_heatpump import resolve_status
 
@@ -26,7 +26,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from datetime import datetime
 
-    from homeassistant.core import HomeAssistant
+    from homeassistant.components.sensor import SensorExtraStoredData
+    from homeassistant.core import HomeAssistant, State
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from homeassistant.helpers.typing import StateType
 
@@ -39,11 +40,11 @@ VENDOR_SLUG_OVERRIDES = {
     "unitstatus": "status_heatpump",
 }
 
-HIDDEN_VENDOR_IDS = {
+HIDDEN_VENDOR_IDS = frozenset({
     "unitstatus",
     "dout_threewayvlv_val",
     "dout_fourwayvlv_val",
-}
+})
 
 # Sensors that should clamp values to minimum 0 (percentages, flow rates)
 CLAMP_TO_ZERO_KEYS = frozenset({
@@ -60,7 +61,20 @@ COP_THROTTLE_KEYS = frozenset({"cop_calc", "generalmng_cop"})
 COP_THROTTLE_SECONDS = 30  # Minimum seconds between state updates
 COP_THROTTLE_THRESHOLD = 0.2  # Force update if value changes by more than this
 
+METRIC_COUNT_PLATFORMS = {
+    "count_sensors": "sensor",
+    "count_binary_sensors": "binary_sensor",
+    "count_switches": "switch",
+}
+
+# Valve position states indexed by the boolean register value (False, True)
+_VALVE_STATES: dict[str, tuple[str, str]] = {
+    "drieweg": ("ch", "dhw"),
+    "vierweg": ("cooling", "heating"),
+}
+
 STANDBY_POWER_WATTS = 17.0
+_STANDBY_KWH_PER_SEC = STANDBY_POWER_WATTS / 3_600_000.0
 STANDBY_POWER_UNIQUE_BASE = "power_standby"
 STANDBY_ENERGY_UNIQUE_BASE = "energy_standby"
 TOTAL_ENERGY_UNIQUE_BASE = "energy_total_incl_standby"
@@ -77,6 +91,51 @@ SCOP_DHW_DAILY_UNIQUE_BASE = "qube_scop_dhw_daily"
 SCOP_MAX_EXPECTED = 10.0
 
 
+class _RoundedValue:
+    """Cache a rounded float until its source value changes."""
+
+    __slots__ = ("_digits", "_raw", "_rounded")
+
+    def __init__(self, digits: int) -> None:
+        """Initialize the cache."""
+        self._digits = digits
+        self._raw: float | None = None
+        self._rounded = 0.0
+
+    def __call__(self, raw: float) -> float:
+        """Return raw rounded to the configured digits, reusing the last result."""
+        if raw != self._raw:
+            self._raw = raw
+            self._rounded = round(raw, self._digits)
+        return self._rounded
+
+
+def _as_float(value: Any) -> float | None:
+    """Convert a coordinator value to float, returning None when not numeric."""
+    if value is None:
+        return None
+    if type(value) is float:
+        return value
+    if isinstance(value, int):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _restored_energy(
+    last_data: SensorExtraStoredData | None, last_state: State | None
+) -> float | None:
+    """Return the restored energy, falling back to the state of older releases."""
+    if last_data is not None and last_data.native_value is not None:
+        return _as_float(last_data.native_value) or 0.0
+    # Older releases did not store sensor extra data, only the state string
+    if last_state is None or last_state.state in ("", "unknown", "unavailable"):
+        return None
+    return _as_float(last_state.state) or 0.0
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: QubeConfigEntry,
@@ -91,34 +150,11 @@ async def async_setup_entry(
     # show_label is no longer used (entity IDs are auto-generated from device name)
     show_label = False
 
-    base_counts = {
-        "sensor": sum(1 for e in hub.entities if e.platform == "sensor"),
-        "binary_sensor": sum(1 for e in hub.entities if e.platform == "binary_sensor"),
-        "switch": sum(1 for e in hub.entities if e.platform == "switch"),
-    }
-
-    extra_counts = {"sensor": 0, "binary_sensor": 0, "switch": 0}
-
-    entities: list[SensorEntity] = []
-
-    def _add_sensor_entity(
-        entity: SensorEntity, include_in_sensor_total: bool = True
-    ) -> None:
-        if include_in_sensor_total:
-            extra_counts["sensor"] += 1
-        entities.append(entity)
-
-    # Use a container for counts to pass to sensors
-    counts_holder: dict[str, dict[str, int] | None] = {"value": None}
-
-    # Surface the resolved host IP as its own diagnostic sensor
-    _add_sensor_entity(
-        QubeIPAddressSensor(coordinator, hub, show_label, multi_device, version)
-    )
-
-    # Diagnostic metrics (error counters only)
-    for kind in ("errors_connect", "errors_read"):
-        _add_sensor_entity(
+    entities: list[SensorEntity] = [
+        # Surface the resolved host IP as its own diagnostic sensor
+        QubeIPAddressSensor(coordinator, hub, show_label, multi_device, version),
+        # Diagnostic metrics (error counters only)
+        *(
             QubeMetricSensor(
                 coordinator,
                 hub,
@@ -126,29 +162,27 @@ async def async_setup_entry(
                 multi_device,
                 version,
                 kind=kind,
-                counts_provider=None,
-            ),
-            include_in_sensor_total=True,
-        )
-
-    for ent in hub.entities:
-        if ent.platform != "sensor":
-            continue
-        _add_sensor_entity(
-            QubeSensor(
-                coordinator,
-                hub,
-                show_label,
-                multi_device,
-                version,
-                ent,
             )
+            for kind in ("errors_connect", "errors_read")
+        ),
+    ]
+
+    entities.extend(
+        QubeSensor(
+            coordinator,
+            hub,
+            show_label,
+            multi_device,
+            version,
+            ent,
         )
+        for ent in hub.entities_by_platform.get("sensor", ())
+    )
 
     # 1) Heat pump status (computed from status code)
     status_src = _find_status_source(hub)
     if status_src is not None:
-        _add_sensor_entity(
+        entities.append(
             QubeComputedSensor(
                 coordinator,
                 hub,
@@ -165,7 +199,7 @@ async def async_setup_entry(
     # 2) Three-way valve status (binary sensor 4)
     drie_src = _find_binary_by_address(hub, 4)
     if drie_src is not None:
-        _add_sensor_entity(
+        entities.append(
             QubeComputedSensor(
                 coordinator,
                 hub,
@@ -182,7 +216,7 @@ async def async_setup_entry(
     # 3) Four-way valve status (binary sensor 2)
     vier_src = _find_binary_by_address(hub, 2)
     if vier_src is not None:
-        _add_sensor_entity(
+        entities.append(
             QubeComputedSensor(
                 coordinator,
                 hub,
@@ -196,6 +230,11 @@ async def async_setup_entry(
             )
         )
 
+    # Use unscoped data keys for coordinator lookups
+    energy_data_key = _energy_data_key()
+    thermic_data_key = _thermic_energy_data_key()
+    binary_data_key = _binary_data_key()
+
     standby_power = QubeStandbyPowerSensor(
         coordinator, hub, show_label, multi_device, version
     )
@@ -208,67 +247,84 @@ async def async_setup_entry(
         show_label,
         multi_device,
         version,
-        data_key=_energy_data_key(),
+        data_key=energy_data_key,
         standby_sensor=standby_energy,
     )
 
-    _add_sensor_entity(standby_power)
-    _add_sensor_entity(standby_energy)
-    _add_sensor_entity(total_energy)
+    entities.extend((standby_power, standby_energy, total_energy))
 
-    # Use unscoped data keys for coordinator lookups
-    energy_data_key = _energy_data_key()
-    thermic_data_key = _thermic_energy_data_key()
-    binary_data_key = _binary_data_key()
-
-    tracker = entry.runtime_data.tariff_tracker
+    tariffs = list(TARIFF_OPTIONS)
+    tracker = data.tariff_tracker
     if tracker is None:
         tracker = TariffEnergyTracker(
             base_key=energy_data_key,
             binary_key=binary_data_key,
-            tariffs=list(TARIFF_OPTIONS),
+            tariffs=tariffs,
         )
-        entry.runtime_data.tariff_tracker = tracker
+        data.tariff_tracker = tracker
     initial_data = coordinator.data or {}
     tracker.set_initial_total(initial_data.get(tracker.base_key))
 
-    thermic_tracker = entry.runtime_data.thermic_tariff_tracker
+    thermic_tracker = data.thermic_tariff_tracker
     if thermic_tracker is None:
         thermic_tracker = TariffEnergyTracker(
             base_key=thermic_data_key,
             binary_key=binary_data_key,
-            tariffs=list(TARIFF_OPTIONS),
+            tariffs=tariffs,
         )
-        entry.runtime_data.thermic_tariff_tracker = thermic_tracker
+        data.thermic_tariff_tracker = thermic_tracker
     thermic_tracker.set_initial_total(initial_data.get(thermic_tracker.base_key))
 
-    daily_electric_tracker = entry.runtime_data.daily_tariff_tracker
+    daily_electric_tracker = data.daily_tariff_tracker
     if daily_electric_tracker is None:
         daily_electric_tracker = TariffEnergyTracker(
             base_key=energy_data_key,
             binary_key=binary_data_key,
-            tariffs=list(TARIFF_OPTIONS),
+            tariffs=tariffs,
             reset_period="day",
         )
-        entry.runtime_data.daily_tariff_tracker = daily_electric_tracker
+        data.daily_tariff_tracker = daily_electric_tracker
     daily_electric_tracker.set_initial_total(
         initial_data.get(daily_electric_tracker.base_key)
     )
 
-    daily_thermic_tracker = entry.runtime_data.daily_thermic_tariff_tracker
+    daily_thermic_tracker = data.daily_thermic_tariff_tracker
     if daily_thermic_tracker is None:
         daily_thermic_tracker = TariffEnergyTracker(
             base_key=thermic_data_key,
             binary_key=binary_data_key,
-            tariffs=list(TARIFF_OPTIONS),
+            tariffs=tariffs,
             reset_period="day",
         )
-        entry.runtime_data.daily_thermic_tariff_tracker = daily_thermic_tracker
+        data.daily_thermic_tariff_tracker = daily_thermic_tracker
     daily_thermic_tracker.set_initial_total(
         initial_data.get(daily_thermic_tracker.base_key)
     )
 
-    _add_sensor_entity(
+    trackers = (
+        tracker,
+        thermic_tracker,
+        daily_electric_tracker,
+        daily_thermic_tracker,
+    )
+    last_data: Any = coordinator.data
+
+    @callback
+    def _async_update_trackers() -> None:
+        """Feed each coordinator refresh to the tariff trackers exactly once."""
+        nonlocal last_data
+        coordinator_data = coordinator.data
+        if coordinator_data is last_data:
+            return
+        last_data = coordinator_data
+        token = getattr(coordinator, "last_update_success_time", None)
+        for energy_tracker in trackers:
+            energy_tracker.update(coordinator_data or {}, token)
+
+    # Registered before the entities so trackers are current when they render
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_trackers))
+
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -281,7 +337,7 @@ async def async_setup_entry(
             object_base="energy_tariff_ch",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -294,7 +350,7 @@ async def async_setup_entry(
             object_base="energy_tariff_dhw",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffTotalEnergySensor(
             coordinator,
             hub,
@@ -307,7 +363,7 @@ async def async_setup_entry(
             object_base="thermische_opbrengst_maand",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -321,7 +377,7 @@ async def async_setup_entry(
             object_base="thermic_yield_ch_month",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -337,7 +393,7 @@ async def async_setup_entry(
     )
 
     # Daily electric consumption sensors
-    _add_sensor_entity(
+    entities.append(
         QubeTariffTotalEnergySensor(
             coordinator,
             hub,
@@ -350,7 +406,7 @@ async def async_setup_entry(
             object_base="electric_consumption_day",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -364,7 +420,7 @@ async def async_setup_entry(
             object_base="electric_consumption_ch_day",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -380,7 +436,7 @@ async def async_setup_entry(
     )
 
     # Daily thermic yield sensors
-    _add_sensor_entity(
+    entities.append(
         QubeTariffTotalEnergySensor(
             coordinator,
             hub,
@@ -393,7 +449,7 @@ async def async_setup_entry(
             object_base="thermic_yield_day",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -407,7 +463,7 @@ async def async_setup_entry(
             object_base="thermic_yield_ch_day",
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeTariffEnergySensor(
             coordinator,
             hub,
@@ -422,7 +478,7 @@ async def async_setup_entry(
         )
     )
 
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -437,7 +493,7 @@ async def async_setup_entry(
             version=version,
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -452,7 +508,7 @@ async def async_setup_entry(
             version=version,
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -468,7 +524,7 @@ async def async_setup_entry(
         )
     )
 
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -483,7 +539,7 @@ async def async_setup_entry(
             version=version,
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -498,7 +554,7 @@ async def async_setup_entry(
             version=version,
         )
     )
-    _add_sensor_entity(
+    entities.append(
         QubeSCOPSensor(
             coordinator,
             hub,
@@ -521,17 +577,17 @@ async def async_setup_entry(
         multi_device,
         version,
         total_counts=None,
+        integration_version=data.integration_version,
     )
-    _add_sensor_entity(info_sensor)
+    entities.append(info_sensor)
 
-    final_counts = {
-        "sensor": base_counts["sensor"] + extra_counts["sensor"],
-        "binary_sensor": base_counts["binary_sensor"],
-        "switch": base_counts["switch"],
-    }
-
-    info_sensor.set_counts(final_counts)
-    counts_holder["value"] = final_counts
+    info_sensor.set_counts(
+        {
+            "sensor": len(entities),
+            "binary_sensor": hub.platform_counts.get("binary_sensor", 0),
+            "switch": hub.platform_counts.get("switch", 0),
+        }
+    )
 
     async_add_entities(entities)
 
@@ -554,14 +610,13 @@ class QubeSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._ent = ent
+        self._data_key = ent.data_key
         self._hub = hub
         self._host = hub.host
         self._unit = hub.unit
         self._label = hub.label
-        self._device_name = hub.device_name
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         if ent.translation_key:
             self._attr_translation_key = ent.translation_key
         else:
@@ -571,13 +626,11 @@ class QubeSensor(CoordinatorEntity, SensorEntity):
         if ent.unique_id:
             self._attr_unique_id = f"{self._host}_{self._unit}_{ent.unique_id}"
         else:
-            suffix_parts = []
-            if ent.input_type:
-                suffix_parts.append(str(ent.input_type))
-            if ent.write_type and not suffix_parts:
-                suffix_parts.append(str(ent.write_type))
-            suffix_parts.append(str(ent.address))
-            suffix = "_".join(str(part) for part in suffix_parts if part)
+            register_type = ent.input_type or ent.write_type
+            if register_type:
+                suffix = f"{register_type}_{ent.address}"
+            else:
+                suffix = str(ent.address)
             unique_base = f"qube_{ent.platform}_{suffix}".lower()
             self._attr_unique_id = f"{self._host}_{self._unit}_{unique_base}"
         vendor_id = getattr(ent, "vendor_id", None)
@@ -606,25 +659,13 @@ class QubeSensor(CoordinatorEntity, SensorEntity):
         self._throttle_last_value: float | None = None
         self._throttle_last_update: datetime | None = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._host}:{self._unit}")},
-            name=self._device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def native_value(self) -> StateType:
         """Return native value."""
-        key = (
-            self._ent.unique_id
-            or f"sensor_{self._ent.input_type or self._ent.write_type}_{self._ent.address}"
-        )
-        value = self.coordinator.data.get(key)
+        data = self.coordinator.data
+        if not data:
+            return None
+        value = data.get(self._data_key)
         if value is None:
             return None
 
@@ -639,31 +680,24 @@ class QubeSensor(CoordinatorEntity, SensorEntity):
         translation_key = self._ent.translation_key or ""
         unique_id = self._ent.unique_id or ""
         if translation_key in CLAMP_TO_ZERO_KEYS or unique_id in CLAMP_TO_ZERO_KEYS:
-            try:
-                num_value = float(value)
+            num_value = _as_float(value)
+            if num_value is not None:
                 return max(0.0, num_value)
-            except (TypeError, ValueError):
-                pass
 
         # Round numeric values when precision is set to reduce state change frequency
         # This applies the actual rounding (not just display precision)
         if self._ent.precision is not None:
-            try:
-                precision = int(self._ent.precision)
-                num_value = float(value)
-                value = round(num_value, precision)
-            except (TypeError, ValueError):
-                pass
+            num_value = _as_float(value)
+            if num_value is not None:
+                with contextlib.suppress(TypeError, ValueError):
+                    value = round(num_value, int(self._ent.precision))
 
         # Throttle COP sensors to reduce update frequency
         # Only update if enough time passed or value changed significantly
         if unique_id in COP_THROTTLE_KEYS or translation_key in COP_THROTTLE_KEYS:
             now = dt_util.utcnow()
-            try:
-                current_value = float(value)
-            except (TypeError, ValueError):
-                pass
-            else:
+            current_value = _as_float(value)
+            if current_value is not None:
                 # Check if we should throttle this update
                 if (
                     self._throttle_last_value is not None
@@ -699,14 +733,14 @@ class QubeInfoSensor(CoordinatorEntity, SensorEntity):
         multi_device: bool,
         version: str,
         total_counts: dict[str, int] | None = None,
+        integration_version: str | None = None,
     ) -> None:
         """Initialize info sensor."""
         super().__init__(coordinator)
         self._hub = hub
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
         self._version = str(version) if version else "unknown"
-        self._integration_version: str | None = None
+        self._attr_device_info = hub.get_device_info(self._version)
+        self._integration_version = integration_version
         self._total_counts = total_counts or {}
         label = hub.label or "qube1"
         self._attr_translation_key = "info"
@@ -715,51 +749,46 @@ class QubeInfoSensor(CoordinatorEntity, SensorEntity):
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{hub.host}_{hub.unit}_info_sensor"
         self._state = "ok"
+        self._written_available: bool | None = None
+        self._attr_extra_state_attributes = self._build_attributes()
 
     def set_counts(self, counts: dict[str, int]) -> None:
         """Update total entity counts."""
         self._total_counts = counts
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+        self._attr_extra_state_attributes = self._build_attributes()
 
     @property
     def native_value(self) -> str:
         """Return state."""
         return self._state
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return attributes."""
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild attributes and write state only when something changed."""
+        attributes = self._build_attributes()
+        available = self.available
+        if (
+            attributes == self._attr_extra_state_attributes
+            and available == self._written_available
+        ):
+            return
+        self._attr_extra_state_attributes = attributes
+        self._written_available = available
+        self.async_write_ha_state()
+
+    def _build_attributes(self) -> dict[str, Any]:
         hub = self._hub
         counts = self._total_counts
         sensors = counts.get("sensor")
         bsens = counts.get("binary_sensor")
         switches = counts.get("switch")
         if sensors is None or bsens is None or switches is None:
-            sensors = (
-                sensors
-                if sensors is not None
-                else sum(1 for e in hub.entities if e.platform == "sensor")
-            )
-            bsens = (
-                bsens
-                if bsens is not None
-                else sum(1 for e in hub.entities if e.platform == "binary_sensor")
-            )
-            switches = (
-                switches
-                if switches is not None
-                else sum(1 for e in hub.entities if e.platform == "switch")
-            )
+            platform_counts = hub.platform_counts
+            if sensors is None:
+                sensors = platform_counts.get("sensor", 0)
+            if bsens is None:
+                bsens = platform_counts.get("binary_sensor", 0)
+            if switches is None:
+                switches = platform_counts.get("switch", 0)
         return {
             "firmware_version": self._version,
             "integration_version": self._integration_version or "unknown",
@@ -774,26 +803,6 @@ class QubeInfoSensor(CoordinatorEntity, SensorEntity):
             "count_switches": switches,
         }
 
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition."""
-        await super().async_added_to_hass()
-        with contextlib.suppress(Exception):
-            await self._async_refresh_integration_version()
-
-    async def _async_refresh_integration_version(self) -> None:
-        """Refresh integration version info."""
-        integ = None
-        with contextlib.suppress(Exception):
-            integ = async_get_loaded_integration(self.hass, DOMAIN)
-        if not integ:
-            with contextlib.suppress(Exception):
-                integ = await async_get_integration(self.hass, DOMAIN)
-        if integ and getattr(integ, "version", None):
-            new_version = str(integ.version)
-            if new_version and new_version != self._integration_version:
-                self._integration_version = new_version
-                self.async_write_ha_state()
-
 
 class QubeIPAddressSensor(CoordinatorEntity, SensorEntity):
     """IP Address Sensor."""
@@ -813,8 +822,7 @@ class QubeIPAddressSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._hub = hub
         self._version = str(version) if version else "unknown"
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
+        self._attr_device_info = hub.get_device_info(self._version)
         label = hub.label or "qube1"
         self._attr_translation_key = "ip_address"
         self.entity_id = f"sensor.{label}_ip_address"
@@ -827,17 +835,6 @@ class QubeIPAddressSensor(CoordinatorEntity, SensorEntity):
             self._attr_device_class = None
         self._attr_icon = "mdi:ip"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def native_value(self) -> str | None:
         """Return IP address."""
@@ -848,6 +845,7 @@ class QubeMetricSensor(CoordinatorEntity, SensorEntity):
     """Metric sensor."""
 
     _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
@@ -858,93 +856,57 @@ class QubeMetricSensor(CoordinatorEntity, SensorEntity):
         multi_device: bool,
         version: str,
         kind: str,
-        counts_provider: Callable[[], dict[str, int] | None] | None = None,
     ) -> None:
         """Initialize metric sensor."""
         super().__init__(coordinator)
         self._hub = hub
         self._kind = kind
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
         self._version = version
-        self._counts_provider = counts_provider
+        self._attr_device_info = hub.get_device_info(self._version)
+        self._value_fn = _metric_value_fn(kind, hub)
         label = hub.label or "qube1"
         self._attr_translation_key = f"metric_{kind}"
         self.entity_id = f"sensor.{label}_metric_{kind}"
         self._attr_has_entity_name = True
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{hub.host}_{hub.unit}_metric_{kind}"
-        with contextlib.suppress(Exception):
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
 
     @property
     def native_value(self) -> int | None:
         """Return native value."""
-        hub = self._hub
-        if self._kind == "errors_connect":
-            return getattr(hub, "err_connect", None)
-        if self._kind == "errors_read":
-            return getattr(hub, "err_read", None)
-        if self._kind == "count_sensors":
-            counts = self._counts_provider() if self._counts_provider else None
-            if counts:
-                return counts.get("sensor", 0)
-            return sum(1 for e in hub.entities if e.platform == "sensor")
-        if self._kind == "count_binary_sensors":
-            counts = self._counts_provider() if self._counts_provider else None
-            if counts:
-                return counts.get("binary_sensor", 0)
-            return sum(1 for e in hub.entities if e.platform == "binary_sensor")
-        if self._kind == "count_switches":
-            counts = self._counts_provider() if self._counts_provider else None
-            if counts:
-                return counts.get("switch", 0)
-            return sum(1 for e in hub.entities if e.platform == "switch")
-        return None
+        return self._value_fn()
 
 
-def _entity_key(ent: EntityDef) -> str:
-    """Generate entity key."""
-    return (
-        ent.unique_id
-        or f"{ent.platform}_{ent.input_type or ent.write_type}_{ent.address}"
-    )
+def _metric_value_fn(kind: str, hub: QubeHub) -> Callable[[], int | None]:
+    """Return a callable producing the value for a metric sensor kind."""
+    if kind == "errors_connect":
+        return lambda: hub.err_connect
+    if kind == "errors_read":
+        return lambda: hub.err_read
+    platform = METRIC_COUNT_PLATFORMS.get(kind)
+    if platform is None:
+        return lambda: None
+    return lambda: hub.platform_counts.get(platform, 0)
 
 
 def _find_status_source(hub: QubeHub) -> EntityDef | None:
     """Find status source entity."""
-    for ent in hub.entities:
-        if ent.platform == "sensor" and (
-            ent.unique_id == "wp_qube_warmtepomp_unit_status"
-        ):
-            return ent
-    cand: EntityDef | None = None
-    for ent in hub.entities:
-        if ent.platform != "sensor":
-            continue
-        if (ent.device_class == "enum") or ("status" in (ent.name or "").lower()):
-            cand = ent
-            break
-    return cand
+    ent = hub.get_entity_by_unique_id("wp_qube_warmtepomp_unit_status")
+    if ent is not None and ent.platform == "sensor":
+        return ent
+    return next(
+        (
+            ent
+            for ent in hub.entities_by_platform.get("sensor", ())
+            if ent.device_class == "enum" or "status" in ent.name_lower
+        ),
+        None,
+    )
 
 
 def _find_binary_by_address(hub: QubeHub, address: int) -> EntityDef | None:
     """Find binary sensor by address."""
-    for ent in hub.entities:
-        if ent.platform == "binary_sensor" and int(ent.address) == int(address):
-            return ent
-    return None
+    return hub.get_entity_by_address("binary_sensor", address)
 
 
 def _scope_unique_id(base: str, host: str, unit: int) -> str:
@@ -963,9 +925,13 @@ def _energy_unique_id(host: str, unit: int) -> str:
 
 
 class QubeStandbyPowerSensor(CoordinatorEntity, SensorEntity):
-    """Standby power sensor."""
+    """Standby power sensor (constant value, availability follows the coordinator)."""
 
     _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "W"
+    _attr_native_value = STANDBY_POWER_WATTS
 
     def __init__(
         self,
@@ -979,37 +945,32 @@ class QubeStandbyPowerSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._hub = hub
         self._label = hub.label or "qube1"
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._attr_translation_key = "standby_power"
         self.entity_id = f"sensor.{self._label}_standby_power"
         self._attr_has_entity_name = True
         self._attr_unique_id = _scope_unique_id(
             STANDBY_POWER_UNIQUE_BASE, hub.host, hub.unit
         )
-        self._attr_device_class = SensorDeviceClass.POWER
-        with contextlib.suppress(ValueError, TypeError):
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "W"
-        self._attr_native_value = STANDBY_POWER_WATTS
+        self._written_available: bool | None = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability changed."""
+        available = self.available
+        if available == self._written_available:
+            return
+        self._written_available = available
+        self.async_write_ha_state()
 
 
 class QubeStandbyEnergySensor(CoordinatorEntity, RestoreSensor, SensorEntity):
     """Standby energy sensor."""
 
     _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "kWh"
 
     def __init__(
         self,
@@ -1023,65 +984,54 @@ class QubeStandbyEnergySensor(CoordinatorEntity, RestoreSensor, SensorEntity):
         super().__init__(coordinator)
         self._hub = hub
         self._label = hub.label or "qube1"
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._energy_kwh: float = 0.0
-        self._last_update: datetime | None = None
+        self._rounded = _RoundedValue(3)
+        self._last_data: Any = None
+        self._last_monotonic: float | None = None
         self._attr_translation_key = "standby_energy"
         self.entity_id = f"sensor.{self._label}_standby_energy"
         self._attr_has_entity_name = True
         self._attr_unique_id = _scope_unique_id(
             STANDBY_ENERGY_UNIQUE_BASE, hub.host, hub.unit
         )
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        with contextlib.suppress(ValueError, TypeError):
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = "kWh"
 
     async def async_added_to_hass(self) -> None:
         """Handle entity addition."""
         await super().async_added_to_hass()
         last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "", "unknown", "unavailable"):
-            try:
-                self._energy_kwh = float(last_state.state)
-            except (TypeError, ValueError):
-                self._energy_kwh = 0.0
-            self._last_update = last_state.last_changed
-        if self._last_update is None:
-            self._last_update = dt_util.utcnow()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+        energy = _restored_energy(await self.async_get_last_sensor_data(), last_state)
+        if energy is not None:
+            self._energy_kwh = energy
+            if last_state is not None:
+                # Backdate the integration start so downtime is accounted for
+                downtime = (dt_util.utcnow() - last_state.last_changed).total_seconds()
+                self._last_monotonic = time.monotonic() - max(downtime, 0.0)
+        if self._last_monotonic is None:
+            self._last_monotonic = time.monotonic()
 
     @property
     def native_value(self) -> float:
         """Return value."""
-        return round(self._energy_kwh, 3)
+        return self._rounded(self._energy_kwh)
 
     def _integrate(self) -> None:
-        now = dt_util.utcnow()
-        if self._last_update is None:
-            self._last_update = now
+        now = time.monotonic()
+        if self._last_monotonic is None:
+            self._last_monotonic = now
             return
-        elapsed = (now - self._last_update).total_seconds()
+        elapsed = now - self._last_monotonic
         if elapsed <= 0:
             return
-        self._last_update = now
-        delta_kwh = (STANDBY_POWER_WATTS / 1000.0) * (elapsed / 3600.0)
-        self._energy_kwh += delta_kwh
+        self._last_monotonic = now
+        self._energy_kwh += _STANDBY_KWH_PER_SEC * elapsed
 
     def _handle_coordinator_update(self) -> None:
-        self._integrate()
+        data = self.coordinator.data
+        if data is not self._last_data:
+            self._last_data = data
+            self._integrate()
         super()._handle_coordinator_update()
 
     def current_energy(self) -> float:
@@ -1094,6 +1044,9 @@ class QubeTotalEnergyIncludingStandbySensor(CoordinatorEntity, SensorEntity):
     """Total energy sensor."""
 
     _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "kWh"
 
     def __init__(
         self,
@@ -1109,12 +1062,13 @@ class QubeTotalEnergyIncludingStandbySensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._hub = hub
         self._label = hub.label or "qube1"
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._data_key = data_key  # Unscoped key for coordinator data lookup
         self._standby_sensor = standby_sensor
         self._total_energy: float | None = None
+        self._rounded = _RoundedValue(3)
+        self._last_data: Any = None
         self._attr_translation_key = "total_energy_incl_standby"
         self.entity_id = f"sensor.{self._label}_total_energy_incl_standby"
         self._attr_has_entity_name = True
@@ -1122,39 +1076,25 @@ class QubeTotalEnergyIncludingStandbySensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = _scope_unique_id(
             TOTAL_ENERGY_UNIQUE_BASE, hub.host, hub.unit
         )
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        with contextlib.suppress(ValueError, TypeError):
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = "kWh"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
 
     @property
     def native_value(self) -> float | None:
         """Return value."""
-        return None if self._total_energy is None else round(self._total_energy, 3)
+        if self._total_energy is None:
+            return None
+        return self._rounded(self._total_energy)
 
     def _handle_coordinator_update(self) -> None:
-        # Use unscoped data_key for coordinator lookup
-        base_value = self.coordinator.data.get(self._data_key)
-        standby = self._standby_sensor.current_energy()
-        try:
-            base_float = float(base_value) if base_value is not None else None
-        except (TypeError, ValueError):
-            base_float = None
-        if base_float is None:
-            self._total_energy = None
-        else:
-            self._total_energy = base_float + standby
+        data = self.coordinator.data
+        if data is not self._last_data:
+            self._last_data = data
+            # Use unscoped data_key for coordinator lookup
+            base_float = _as_float(data.get(self._data_key))
+            standby = self._standby_sensor.current_energy()
+            if base_float is None:
+                self._total_energy = None
+            else:
+                self._total_energy = base_float + standby
         super()._handle_coordinator_update()
 
 
@@ -1181,9 +1121,12 @@ class QubeComputedSensor(CoordinatorEntity, SensorEntity):
         self._hub = hub
         self._kind = kind
         self._source = source
+        self._data_key = source.data_key
+        self._valve_states = _VALVE_STATES.get(kind)
+        self._last_value: str | None = None
+        self._written_available: bool | None = None
         self._version = version
-        self._multi_device = bool(multi_device)
-        self._show_label = bool(show_label)
+        self._attr_device_info = hub.get_device_info(self._version)
         self._label = hub.label or "qube1"
         self._object_base = _slugify(object_base) if object_base else _slugify(kind)
         self._attr_translation_key = translation_key
@@ -1192,37 +1135,34 @@ class QubeComputedSensor(CoordinatorEntity, SensorEntity):
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_qube_{unique_suffix}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def native_value(self) -> str | None:
         """Return native value."""
-        key = _entity_key(self._source)
-        val = self.coordinator.data.get(key)
+        val = self.coordinator.data.get(self._data_key)
         if val is None:
             return None
-        with contextlib.suppress(Exception):
-            if self._kind == "status":
-                code = int(val)
-                antileg = self.coordinator.data.get("req_antileg_1")
-                return resolve_status(code, antileg).value
-            if self._kind == "drieweg":
-                # DHW (True) vs CH (False)
-                return "dhw" if bool(val) else "ch"
-            if self._kind == "vierweg":
-                # Verwarmen (True) vs Koelen (False) -> heating/cooling
-                return "heating" if bool(val) else "cooling"
+        if self._valve_states is not None:
+            # drieweg: DHW (True) vs CH (False); vierweg: heating vs cooling
+            return self._valve_states[bool(val)]
+        if self._kind == "status":
+            try:
+                code = val if type(val) is int else int(val)
+            except (TypeError, ValueError, OverflowError):
+                return None
+            antileg = self.coordinator.data.get("req_antileg_1")
+            return resolve_status(code, antileg).value
         return None
 
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the derived value or availability changed."""
+        value = self.native_value
+        available = self.available
+        if value == self._last_value and available == self._written_available:
+            return
+        self._last_value = value
+        self._written_available = available
+        self.async_write_ha_state()
+
 
 def _start_of_month(dt_value: datetime) -> datetime:
     return dt_value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -1255,6 +1195,20 @@ def _binary_unique_id(host: str, unit: int) -> str:
 class TariffEnergyTracker:
     """Track split energy totals for CH/DHW (Central Heating / Domestic Hot Water)."""
 
+    __slots__ = (
+        "_current_tariff",
+        "_last_reset",
+        "_last_reset_key",
+        "_last_token",
+        "_last_total",
+        "_reset_period",
+        "_total",
+        "_totals",
+        "base_key",
+        "binary_key",
+        "tariffs",
+    )
+
     def __init__(
         self,
         base_key: str,
@@ -1267,10 +1221,13 @@ class TariffEnergyTracker:
         self.binary_key = binary_key
         self.tariffs = list(tariffs)
         self._totals: dict[str, float] = dict.fromkeys(tariffs, 0.0)
+        self._total = 0.0
         self._current_tariff: str = tariffs[0]
         self._last_total: float | None = None
         self._reset_period = reset_period
-        self._last_reset: datetime = self._cycle_start(dt_util.utcnow())
+        self._last_reset: datetime
+        self._last_reset_key: int
+        self._set_last_reset(self._cycle_start(dt_util.utcnow()))
         self._last_token: datetime | None = None
 
     @property
@@ -1283,36 +1240,48 @@ class TariffEnergyTracker:
         """Return last reset time."""
         return self._last_reset
 
+    @property
+    def total(self) -> float:
+        """Return the sum over all tariffs."""
+        return self._total
+
     def restore_total(
         self, tariff: str, value: float, last_reset: datetime | None
     ) -> None:
         """Restore total from previous state."""
         if tariff in self._totals:
             self._totals[tariff] = max(0.0, value)
+            self._total = sum(self._totals.values())
         if last_reset and last_reset > self._last_reset:
-            self._last_reset = last_reset
+            self._set_last_reset(last_reset)
 
     def set_initial_total(self, total: float | None) -> None:
         """Set initial total."""
         if total is None:
             return
-        try:
-            self._last_total = float(total)
-        except (TypeError, ValueError):
-            self._last_total = None
+        self._last_total = _as_float(total)
 
     def _cycle_start(self, dt_value: datetime) -> datetime:
         if self._reset_period == "day":
             return _start_of_day(dt_value)
         return _start_of_month(dt_value)
 
+    def _period_key(self, dt_value: datetime) -> int:
+        if self._reset_period == "day":
+            return dt_value.toordinal()
+        return dt_value.year * 12 + dt_value.month
+
+    def _set_last_reset(self, value: datetime) -> None:
+        self._last_reset = value
+        self._last_reset_key = self._period_key(value)
+
     def _reset_if_needed(self, reference: datetime | None) -> None:
         now = reference or dt_util.utcnow()
-        start = self._cycle_start(now)
-        if start > self._last_reset:
-            self._last_reset = start
+        if self._period_key(now) > self._last_reset_key:
+            self._set_last_reset(self._cycle_start(now))
             for tariff in self._totals:
                 self._totals[tariff] = 0.0
+            self._total = 0.0
 
     def update(self, coordinator_data: dict[str, Any], token: datetime | None) -> None:
         """Update tracker with new data."""
@@ -1328,10 +1297,7 @@ class TariffEnergyTracker:
             self._last_token = token
 
         base_val = coordinator_data.get(self.base_key)
-        try:
-            base_float = float(base_val) if base_val is not None else None
-        except (TypeError, ValueError):
-            base_float = None
+        base_float = _as_float(base_val)
 
         self._refresh_current_tariff(coordinator_data)
 
@@ -1350,6 +1316,7 @@ class TariffEnergyTracker:
         reference = token or dt_util.utcnow()
         self._reset_if_needed(reference)
         self._totals[self._current_tariff] += delta
+        self._total += delta
 
     def _refresh_current_tariff(self, coordinator_data: dict[str, Any]) -> None:
         state = coordinator_data.get(self.binary_key)
@@ -1365,6 +1332,9 @@ class QubeTariffEnergySensor(CoordinatorEntity, RestoreSensor, SensorEntity):
     """Tariff energy sensor."""
 
     _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "kWh"
 
     def __init__(
         self,
@@ -1385,32 +1355,23 @@ class QubeTariffEnergySensor(CoordinatorEntity, RestoreSensor, SensorEntity):
         self._tracker = tracker
         self._tariff = tariff
         self._label = hub.label or "qube1"
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._attr_translation_key = translation_key
         self.entity_id = f"sensor.{self._label}_{translation_key}"
         self._attr_has_entity_name = True
         base_uid = f"{(base_unique or TARIFF_SENSOR_BASE)}_{tariff.lower()}"
         self._attr_unique_id = _scope_unique_id(base_uid, hub.host, hub.unit)
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        with contextlib.suppress(ValueError, TypeError):
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = "kWh"
+        self._rounded = _RoundedValue(3)
 
     async def async_added_to_hass(self) -> None:
         """Handle entity addition."""
         await super().async_added_to_hass()
         last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "", "unknown", "unavailable"):
-            try:
-                value = float(last_state.state)
-            except (TypeError, ValueError):
-                value = 0.0
+        value = _restored_energy(await self.async_get_last_sensor_data(), last_state)
+        if value is not None:
             last_reset: datetime | None = None
-            if hasattr(last_state, "last_reset"):
-                last_reset = last_state.last_reset
-            if not last_reset:
+            if last_state is not None:
                 cycle_start = (
                     last_state.attributes.get("cycle_start")
                     if last_state.attributes
@@ -1422,38 +1383,24 @@ class QubeTariffEnergySensor(CoordinatorEntity, RestoreSensor, SensorEntity):
                         last_reset = parsed
             self._tracker.restore_total(self._tariff, value, last_reset)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def native_value(self) -> float:
         """Return value."""
-        return round(self._tracker.get_total(self._tariff), 3)
+        return self._rounded(self._tracker.get_total(self._tariff))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return attributes."""
         return {"cycle_start": self._tracker.last_reset.isoformat()}
 
-    def _handle_coordinator_update(self) -> None:
-        token = getattr(self.coordinator, "last_update_success_time", None)
-        data = self.coordinator.data or {}
-        self._tracker.update(data, token)
-        super()._handle_coordinator_update()
-
 
 class QubeTariffTotalEnergySensor(CoordinatorEntity, SensorEntity):
     """Tariff total sensor."""
 
     _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "kWh"
 
     def __init__(
         self,
@@ -1472,50 +1419,32 @@ class QubeTariffTotalEnergySensor(CoordinatorEntity, SensorEntity):
         self._hub = hub
         self._tracker = tracker
         self._label = hub.label or "qube1"
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._attr_translation_key = translation_key
         self.entity_id = f"sensor.{self._label}_{translation_key}"
         self._attr_has_entity_name = True
         self._attr_unique_id = _scope_unique_id(base_unique, hub.host, hub.unit)
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        with contextlib.suppress(ValueError, TypeError):
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = "kWh"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+        self._rounded = _RoundedValue(3)
 
     @property
     def native_value(self) -> float:
         """Return value."""
-        return round(sum(self._tracker.get_total(t) for t in self._tracker.tariffs), 3)
+        return self._rounded(self._tracker.total)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return attributes."""
         return {"cycle_start": self._tracker.last_reset.isoformat()}
 
-    def _handle_coordinator_update(self) -> None:
-        token = getattr(self.coordinator, "last_update_success_time", None)
-        data = self.coordinator.data or {}
-        self._tracker.update(data, token)
-        super()._handle_coordinator_update()
-
 
 class QubeSCOPSensor(CoordinatorEntity, SensorEntity):
     """SCOP sensor."""
 
     _attr_should_poll = False
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_unit_of_measurement = "CoP"
+    _attr_suggested_display_precision = 1
 
     def __init__(
         self,
@@ -1538,36 +1467,19 @@ class QubeSCOPSensor(CoordinatorEntity, SensorEntity):
         self._thermic = thermic_tracker
         self._scope = scope
         self._label = hub.label or "qube1"
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         self._attr_translation_key = translation_key
         self.entity_id = f"sensor.{self._label}_{translation_key}"
         self._attr_has_entity_name = True
         self._object_base = object_base
         # Always scope unique_id per device for stability
         self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_{unique_base}"
-        self._attr_suggested_display_precision = 1
-        self._attr_native_unit_of_measurement = "CoP"
-        with contextlib.suppress(Exception):
-            self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
+        self._scop_cache: tuple[float, float, float] | None = None
 
     def _current_totals(self) -> tuple[float | None, float | None]:
         if self._scope == "total":
-            elec = sum(self._electric.get_total(t) for t in self._electric.tariffs)
-            therm = sum(self._thermic.get_total(t) for t in self._thermic.tariffs)
-            return elec, therm
+            return self._electric.total, self._thermic.total
         elec = self._electric.get_total(self._scope)
         therm = self._thermic.get_total(self._scope)
         return elec, therm
@@ -1576,23 +1488,17 @@ class QubeSCOPSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return value."""
         elec, therm = self._current_totals()
-        if elec is None or therm is None:
-            return 0.0
-        try:
-            elec_f = float(elec)
-            therm_f = float(therm)
-        except (TypeError, ValueError):
-            return 0.0
-        if elec_f <= 0:
+        elec_f = _as_float(elec)
+        therm_f = _as_float(therm)
+        if elec_f is None or therm_f is None:
             return 0.0
-        scop = therm_f / elec_f
-        if scop < 0 or scop > SCOP_MAX_EXPECTED:
-            return 0.0
-        return round(scop, 1)
-
-    def _handle_coordinator_update(self) -> None:
-        token = getattr(self.coordinator, "last_update_success_time", None)
-        data = self.coordinator.data or {}
-        self._electric.update(data, token)
-        self._thermic.update(data, token)
-        super()._handle_coordinator_update()
+        cache = self._scop_cache
+        if cache is not None and cache[0] == elec_f and cache[1] == therm_f:
+            return cache[2]
+        result = 0.0
+        if elec_f > 0:
+            scop = therm_f / elec_f
+            if 0 <= scop <= SCOP_MAX_EXPECTED:
+                result = round(scop, 1)
+        self._scop_cache = (elec_f, therm_f, result)
+        return result
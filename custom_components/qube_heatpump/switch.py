@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import EntityCategory
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -35,10 +34,8 @@ async def async_setup_entry(
     version = data.version or "unknown"
 
     entities: list[SwitchEntity] = []
-    for ent in hub.entities:
-        if ent.platform != "switch":
-            continue
-        if ent.vendor_id in {"bms_sgready_a", "bms_sgready_b"}:
+    for ent in hub.entities_by_platform.get("switch", ()):
+        if ent.vendor_id in SGREADY_SWITCHES:
             continue
         entities.append(
             QubeSwitch(coordinator, hub, show_label, multi_device, ent, version)
@@ -48,8 +45,7 @@ async def async_setup_entry(
 
     # Cleanup deprecated SG Ready entities (check both old and new unique_id formats)
     registry = er.async_get(hass)
-    to_remove_base = ["bms_sgready_a", "bms_sgready_b"]
-    for base in to_remove_base:
+    for base in SGREADY_SWITCHES:
         # Check for old format (non-scoped)
         entity_id = registry.async_get_entity_id("switch", DOMAIN, base)
         if entity_id:
@@ -69,6 +65,9 @@ CONTROL_SWITCHES = frozenset({
     "antilegionella_frcstart_ant",
 })
 
+# SG Ready bits are driven through the select entity, not as switches
+SGREADY_SWITCHES = frozenset({"bms_sgready_a", "bms_sgready_b"})
+
 
 class QubeSwitch(CoordinatorEntity, SwitchEntity):
     """Qube switch entity."""
@@ -88,14 +87,14 @@ class QubeSwitch(CoordinatorEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         self._ent = ent
+        self._data_key = ent.data_key
         self._hub = hub
-        self._show_label = bool(show_label)
-        self._multi_device = bool(multi_device)
         self._version = version
+        self._attr_device_info = hub.get_device_info(self._version)
         # Control switches go in Controls section, others in Configuration
         if ent.vendor_id not in CONTROL_SWITCHES:
             self._attr_entity_category = EntityCategory.CONFIG
-        if ent.vendor_id in {"bms_sgready_a", "bms_sgready_b"}:
+        if ent.vendor_id in SGREADY_SWITCHES:
             self._attr_entity_registry_visible_default = False
         # Use vendor_id for stable, predictable entity IDs
         if ent.vendor_id:
@@ -113,25 +112,10 @@ class QubeSwitch(CoordinatorEntity, SwitchEntity):
             base_uid = f"qube_switch_{suffix}"
             self._attr_unique_id = f"{self._hub.host}_{self._hub.unit}_{base_uid}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._hub.host}:{self._hub.unit}")},
-            name=self._hub.device_name,
-            manufacturer="Qube",
-            model="Heat Pump",
-            sw_version=self._version,
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
-        key = (
-            self._ent.unique_id
-            or f"switch_{self._ent.input_type or self._ent.write_type}_{self._ent.address}"
-        )
-        val = self.coordinator.data.get(key)
+        val = self.coordinator.data.get(self._data_key)
         return None if val is None else bool(val)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
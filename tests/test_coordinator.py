@@ -258,20 +258,19 @@ def test_needs_monotonic_clamping_edge_cases() -> None:
     assert _needs_monotonic_clamping(ent) is False
 
 
-def test_entity_key_generation() -> None:
-    """Test _entity_key generates correct keys."""
-    from custom_components.qube_heatpump.coordinator import _entity_key
+def test_entity_data_key_generation() -> None:
+    """Test data_key generates correct coordinator keys."""
     from custom_components.qube_heatpump.hub import EntityDef
 
     # Test with unique_id
     ent = EntityDef(
         platform="sensor", name="Test", address=100, unique_id="test_sensor"
     )
-    assert _entity_key(ent) == "test_sensor"
+    assert ent.data_key == "test_sensor"
 
     # Test without unique_id (fallback to address-based key)
     ent2 = EntityDef(platform="sensor", name="Test", address=100, input_type="holding")
-    assert _entity_key(ent2) == "sensor_holding_100"
+    assert ent2.data_key == "sensor_holding_100"
 
 
 async def test_coordinator_non_finite_value(
@@ -406,7 +405,6 @@ def test_rounding_before_monotonic_clamp() -> None:
     """
     import struct
 
-    from custom_components.qube_heatpump.coordinator import _entity_key
     from custom_components.qube_heatpump.hub import EntityDef
 
     # Simulate an energy sensor (kWh, precision=2, total_increasing)
@@ -421,7 +419,7 @@ def test_rounding_before_monotonic_clamp() -> None:
         precision=2,
     )
 
-    key = _entity_key(ent)
+    key = ent.data_key
     monotonic_cache: dict[str, float] = {}
 
     def simulate_coordinator_poll(raw_value: float) -> float:
@@ -306,32 +306,35 @@ class TestBinarySensorAlarmHelpers:
         )
         assert _is_alarm_entity(ent) is False
 
-    def test_entity_state_key_with_unique_id(self) -> None:
-        """Test _entity_state_key returns unique_id when set."""
-        from custom_components.qube_heatpump.binary_sensor import _entity_state_key
+    def test_alarm_keys_use_data_key(self) -> None:
+        """Test the alarm aggregate reads each alarm under its data key."""
+        from custom_components.qube_heatpump.binary_sensor import (
+            QubeAlarmStatusBinarySensor,
+        )
         from custom_components.qube_heatpump.hub import EntityDef
 
-        ent = EntityDef(
+        with_uid = EntityDef(
             platform="binary_sensor",
-            name="Test",
+            name="Alarm A",
             address=100,
             unique_id="my_unique_id",
         )
-        assert _entity_state_key(ent) == "my_unique_id"
-
-    def test_entity_state_key_fallback(self) -> None:
-        """Test _entity_state_key returns generated key when no unique_id."""
-        from custom_components.qube_heatpump.binary_sensor import _entity_state_key
-        from custom_components.qube_heatpump.hub import EntityDef
-
-        ent = EntityDef(
+        without_uid = EntityDef(
             platform="binary_sensor",
-            name="Test",
-            address=100,
+            name="Alarm B",
+            address=101,
             input_type="discrete",
         )
-        ent.unique_id = None
-        assert _entity_state_key(ent) == "binary_sensor_discrete_100"
+        without_uid.unique_id = None
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        sensor = QubeAlarmStatusBinarySensor(
+            MagicMock(), hub, False, False, [with_uid, without_uid]
+        )
+        assert sensor._keys == ["my_unique_id", "binary_sensor_discrete_101"]
 
 
 class TestSwitchSGReady:
@@ -71,6 +71,13 @@ class TestSlugify:
         """Test slugify with mixed content."""
         assert slugify("Qube Heat Pump (192.168.1.50)") == "qube_heat_pump__192_168_1_50"
 
+    def test_repeated_calls_use_cache(self) -> None:
+        """Test repeated slugify calls are served from the cache."""
+        slugify.cache_clear()
+        assert slugify("Cached Value") == "cached_value"
+        assert slugify("Cached Value") == "cached_value"
+        assert slugify.cache_info().hits == 1
+
 
 class TestSuggestObjectId:
     """Tests for the suggest_object_id function."""
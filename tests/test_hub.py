@@ -6,7 +6,8 @@ import contextlib
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.qube_heatpump.hub import QubeHub
+from custom_components.qube_heatpump.const import DOMAIN
+from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -49,6 +50,10 @@ async def test_hub_default_label(hass: HomeAssistant) -> None:
 
         assert hub.label == "qube_1"
 
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry_id", 1, "Qube -- Heat Pump!")
+        assert hub.label == "qube_heat_pump"
+        assert hub.label is hub.label
+
 
 async def test_hub_connect_success(hass: HomeAssistant) -> None:
     """Test successful connection."""
@@ -146,6 +151,55 @@ async def test_hub_load_library_entities(hass: HomeAssistant) -> None:
         assert len(hub.entities) > 0
 
 
+async def test_hub_platform_counts(hass: HomeAssistant) -> None:
+    """Test hub platform buckets are cached and reset when entities change."""
+    hub = QubeHub(hass, "1.2.3.4", 502, "test_entry_id", 1, "qube1")
+    temp = EntityDef(platform="sensor", name="Temp", address=100)
+    power = EntityDef(platform="sensor", name="Power", address=101)
+    enable = EntityDef(platform="switch", name="Enable", address=1)
+    hub.entities = [temp, enable, power]
+    assert hub.entities_by_platform == {"sensor": [temp, power], "switch": [enable]}
+    counts = hub.platform_counts
+    assert counts == {"sensor": 2, "switch": 1}
+    assert hub.platform_counts is counts
+
+    hub.entities = [EntityDef(platform="binary_sensor", name="Alarm", address=1)]
+    assert list(hub.entities_by_platform) == ["binary_sensor"]
+    assert hub.platform_counts == {"binary_sensor": 1}
+
+
+async def test_hub_entity_lookups(hass: HomeAssistant) -> None:
+    """Test hub lookups by address and unique_id return the first match."""
+    hub = QubeHub(hass, "1.2.3.4", 502, "test_entry_id", 1, "qube1")
+    first = EntityDef(platform="binary_sensor", name="A", address=4, unique_id="a")
+    second = EntityDef(platform="binary_sensor", name="B", address=4, unique_id="a")
+    sensor = EntityDef(platform="sensor", name="C", address=4, unique_id="c")
+    hub.entities = [first, second, sensor]
+
+    assert hub.get_entity_by_address("binary_sensor", 4) is first
+    assert hub.get_entity_by_address("sensor", 4) is sensor
+    assert hub.get_entity_by_address("switch", 4) is None
+    assert hub.get_entity_by_unique_id("a") is first
+    assert hub.get_entity_by_unique_id("missing") is None
+
+    hub.entities = [second]
+    assert hub.get_entity_by_address("binary_sensor", 4) is second
+
+
+async def test_hub_device_info(hass: HomeAssistant) -> None:
+    """Test hub device info is shared per version and follows unit changes."""
+    hub = QubeHub(hass, "1.2.3.4", 502, "test_entry_id", 1, "Qube Heat Pump")
+    info = hub.get_device_info("1.0")
+    assert info["identifiers"] == {(DOMAIN, "1.2.3.4:1")}
+    assert info["name"] == "Qube Heat Pump"
+    assert info["sw_version"] == "1.0"
+    assert hub.get_device_info("1.0") is info
+    assert hub.get_device_info("2.0")["sw_version"] == "2.0"
+
+    hub.set_unit_id(2)
+    assert hub.get_device_info("1.0")["identifiers"] == {(DOMAIN, "1.2.3.4:2")}
+
+
 async def test_hub_read_value(hass: HomeAssistant) -> None:
     """Test hub async_read_value."""
     with patch(
@@ -688,3 +742,13 @@ async def test_hub_get_all_entities_not_connected(hass: HomeAssistant) -> None:
 
         with pytest.raises(ConnectionError, match="Client not connected"):
             await hub.async_get_all_entities()
+
+
+def test_entity_def_data_key() -> None:
+    """Test EntityDef.data_key prefers unique_id and falls back to the address."""
+    ent = EntityDef(platform="sensor", name="Temp", address=100, unique_id="temp")
+    assert ent.data_key == "temp"
+
+    ent = EntityDef(platform="switch", name="Pump", address=7, write_type="coil")
+    assert ent.data_key == "switch_coil_7"
+    assert ent.data_key is ent.data_key
@@ -14,6 +14,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.qube_heatpump.const import CONF_HOST, DOMAIN
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.loader import async_get_loaded_integration
 
 if TYPE_CHECKING:
     from freezegun.api import FrozenDateTimeFactory
@@ -175,6 +176,40 @@ async def test_sensor_coordinator_refresh_updates_values(
         assert len(sensor_states) > 0
 
 
+async def test_tariff_trackers_updated_once_per_refresh(
+    hass: HomeAssistant,
+    mock_qube_client: MagicMock,
+) -> None:
+    """Test each tariff tracker is fed once per coordinator refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "1.2.3.4"},
+        title="Qube Heat Pump",
+        unique_id=f"{DOMAIN}-1.2.3.4-502",
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    data = entry.runtime_data
+    trackers = (
+        data.tariff_tracker,
+        data.thermic_tariff_tracker,
+        data.daily_tariff_tracker,
+        data.daily_thermic_tariff_tracker,
+    )
+    with patch(
+        "custom_components.qube_heatpump.sensor.TariffEnergyTracker.update",
+        autospec=True,
+    ) as mock_update:
+        await data.coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert mock_update.call_count == len(trackers)
+    assert {call.args[0] for call in mock_update.call_args_list} == set(trackers)
+
+
 async def test_sensor_handles_none_data(hass: HomeAssistant) -> None:
     """Test sensor handles None data gracefully."""
     with patch(
@@ -310,3 +345,17 @@ async def test_sensor_qube_info_entity(
     if info_sensors:
         attrs = info_sensors[0].attributes
         assert "version" in attrs or "label" in attrs or "host" in attrs
+
+    # Sensor count covers every sensor entity created by the platform
+    info_entry = next(e for e in info_entries if e.unique_id.endswith("_info_sensor"))
+    info_state = hass.states.get(info_entry.entity_id)
+    assert info_state is not None
+    entry_sensors = [
+        e
+        for e in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+        if e.domain == "sensor"
+    ]
+    assert info_state.attributes["count_sensors"] == len(entry_sensors)
+    assert info_state.attributes["integration_version"] == str(
+        async_get_loaded_integration(hass, DOMAIN).version
+    )
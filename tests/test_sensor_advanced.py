@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,8 +13,10 @@ from custom_components.qube_heatpump.const import CONF_HOST, DOMAIN
 from custom_components.qube_heatpump.sensor import (
     SCOP_MAX_EXPECTED,
     TariffEnergyTracker,
+    _as_float,
     _find_binary_by_address,
     _find_status_source,
+    _RoundedValue,
     _scope_unique_id,
     _slugify,
     _start_of_day,
@@ -42,6 +44,26 @@ def test_scope_unique_id() -> None:
     assert _scope_unique_id("test", "1.2.3.4", 1) == "1.2.3.4_1_test"
 
 
+def test_rounded_value() -> None:
+    """Test _RoundedValue only re-rounds when the source value changes."""
+    rounded = _RoundedValue(3)
+    assert rounded(1.23456) == 1.235
+    assert rounded(1.23456) == 1.235
+    assert rounded(2.0004) == 2.0
+    assert _RoundedValue(1)(3.14159) == 3.1
+
+
+def test_as_float() -> None:
+    """Test _as_float handles numeric, string and invalid values."""
+    assert _as_float(None) is None
+    assert _as_float(1.5) == 1.5
+    assert _as_float(2) == 2.0
+    assert isinstance(_as_float(2), float)
+    assert _as_float("3.25") == 3.25
+    assert _as_float("bad") is None
+    assert _as_float([1]) is None
+
+
 def test_start_of_month() -> None:
     """Test _start_of_month function."""
     dt = datetime(2025, 1, 15, 14, 30, 45, 123456)
@@ -58,9 +80,9 @@ def test_start_of_day() -> None:
 
 def test_find_status_source_with_matching_entity() -> None:
     """Test _find_status_source finds status entity."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(
         platform="sensor",
         name="Status",
@@ -74,9 +96,9 @@ def test_find_status_source_with_matching_entity() -> None:
 
 def test_find_status_source_fallback_enum() -> None:
     """Test _find_status_source falls back to enum device_class."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(platform="sensor", name="Other", address=100, device_class="enum")
     hub.entities = [ent1]
     result = _find_status_source(hub)
@@ -85,9 +107,9 @@ def test_find_status_source_fallback_enum() -> None:
 
 def test_find_status_source_fallback_name() -> None:
     """Test _find_status_source falls back to name containing status."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(platform="sensor", name="Unit Status Value", address=100)
     hub.entities = [ent1]
     result = _find_status_source(hub)
@@ -96,9 +118,9 @@ def test_find_status_source_fallback_name() -> None:
 
 def test_find_status_source_no_match() -> None:
     """Test _find_status_source returns None when no match."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(platform="sensor", name="Temperature", address=100)
     hub.entities = [ent1]
     result = _find_status_source(hub)
@@ -107,9 +129,9 @@ def test_find_status_source_no_match() -> None:
 
 def test_find_binary_by_address_found() -> None:
     """Test _find_binary_by_address finds entity."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(platform="binary_sensor", name="Test", address=4)
     hub.entities = [ent1]
     result = _find_binary_by_address(hub, 4)
@@ -118,9 +140,9 @@ def test_find_binary_by_address_found() -> None:
 
 def test_find_binary_by_address_not_found() -> None:
     """Test _find_binary_by_address returns None when not found."""
-    from custom_components.qube_heatpump.hub import EntityDef
+    from custom_components.qube_heatpump.hub import EntityDef, QubeHub
 
-    hub = MagicMock()
+    hub = QubeHub(None, "1.2.3.4", 502, "test_entry")
     ent1 = EntityDef(platform="binary_sensor", name="Test", address=5)
     hub.entities = [ent1]
     result = _find_binary_by_address(hub, 4)
@@ -264,11 +286,47 @@ class TestTariffEnergyTracker:
         tracker._totals["CH"] = 10.0
         old_start = tracker._last_reset
         # Force reset by setting last_reset to yesterday
-        tracker._last_reset = old_start - timedelta(days=1)
+        tracker._set_last_reset(old_start - timedelta(days=1))
         tracker.set_initial_total(50.0)  # Set initial total first
         tracker.update({"energy": 100.0, "tariff": False}, dt_util.utcnow())
         # After reset, _last_reset should be updated to current day start
         assert tracker._last_reset >= old_start
+        assert tracker._totals["CH"] == 50.0
+
+    def test_reset_monthly(self) -> None:
+        """Test monthly tracker resets only when the month changes."""
+        tracker = TariffEnergyTracker(
+            base_key="energy", binary_key="tariff", tariffs=["CH", "DHW"]
+        )
+        tracker._set_last_reset(datetime(2025, 1, 1, tzinfo=UTC))
+        tracker.set_initial_total(100.0)
+        tracker.update(
+            {"energy": 110.0, "tariff": False}, datetime(2025, 1, 31, 23, tzinfo=UTC)
+        )
+        assert tracker._totals["CH"] == 10.0
+
+        tracker.update(
+            {"energy": 115.0, "tariff": False}, datetime(2025, 2, 1, 1, tzinfo=UTC)
+        )
+        assert tracker._totals["CH"] == 5.0
+        assert tracker.last_reset == datetime(2025, 2, 1, tzinfo=UTC)
+        assert tracker.total == 5.0
+
+    def test_total_follows_tariff_totals(self) -> None:
+        """Test the running total matches the per-tariff sum."""
+        tracker = TariffEnergyTracker(
+            base_key="energy", binary_key="tariff", tariffs=["CH", "DHW"]
+        )
+        tracker.restore_total("CH", 3.0, None)
+        tracker.restore_total("DHW", 2.0, None)
+        assert tracker.total == 5.0
+
+        tracker.set_initial_total(100.0)
+        tracker.update({"energy": 104.0, "tariff": True}, None)
+        tracker.update({"energy": 105.0, "tariff": False}, None)
+        assert tracker.get_total("DHW") == 6.0
+        assert tracker.get_total("CH") == 4.0
+        assert tracker.total == 10.0
 
 
 class TestQubeSensorUniqueIdFallback:
@@ -310,6 +368,14 @@ class TestQubeSensorUniqueIdFallback:
 
         # Always scoped with host_unit prefix for stability
         assert sensor._attr_unique_id == "1.2.3.4_1_qube_sensor_holding_100"
+        assert sensor._data_key == "sensor_holding_100"
+        assert sensor.native_value is None
+
+        coordinator.data = None
+        assert sensor.native_value is None
+
+        coordinator.data = {"sensor_holding_100": 21.5}
+        assert sensor.native_value == 21.5
 
     async def test_sensor_unique_id_fallback_write_type(
         self, hass: HomeAssistant
@@ -349,6 +415,31 @@ class TestQubeSensorUniqueIdFallback:
         # Always scoped with host_unit prefix for stability
         assert sensor._attr_unique_id == "1.2.3.4_1_qube_sensor_holding_200"
 
+    async def test_sensor_unique_id_fallback_address_only(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test sensor uses only the address when no register type is set."""
+        from custom_components.qube_heatpump.hub import EntityDef
+        from custom_components.qube_heatpump.sensor import QubeSensor
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+
+        ent = EntityDef(platform="sensor", name="Test Sensor", address=300)
+
+        sensor = QubeSensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+            ent=ent,
+        )
+
+        assert sensor._attr_unique_id == "1.2.3.4_1_qube_sensor_300"
+
     async def test_sensor_unique_id_multi_device(self, hass: HomeAssistant) -> None:
         """Test sensor unique_id includes host_unit prefix in multi_device mode."""
         from custom_components.qube_heatpump.hub import EntityDef
@@ -391,17 +482,10 @@ class TestQubeInfoSensorCountsFallback:
 
     async def test_info_sensor_counts_fallback(self, hass: HomeAssistant) -> None:
         """Test info sensor falls back to counting entities when counts are None."""
-        from custom_components.qube_heatpump.hub import EntityDef
+        from custom_components.qube_heatpump.hub import EntityDef, QubeHub
         from custom_components.qube_heatpump.sensor import QubeInfoSensor
 
-        hub = MagicMock()
-        hub.host = "1.2.3.4"
-        hub.unit = 1
-        hub.label = "qube1"
-        hub.entry_id = "test_entry"
-        hub.resolved_ip = "1.2.3.4"
-        hub.err_connect = 0
-        hub.err_read = 0
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "qube1")
         hub.entities = [
             EntityDef(platform="sensor", name="Temp", address=100),
             EntityDef(platform="sensor", name="Power", address=101),
@@ -427,11 +511,69 @@ class TestQubeInfoSensorCountsFallback:
         assert attrs["count_switches"] == 1
 
 
+    async def test_info_sensor_integration_version(self, hass: HomeAssistant) -> None:
+        """Test info sensor reports the integration version it was given."""
+        from custom_components.qube_heatpump.hub import QubeHub
+        from custom_components.qube_heatpump.sensor import QubeInfoSensor
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "qube1")
+        sensor = QubeInfoSensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+            integration_version="2.3.4",
+        )
+        assert sensor.extra_state_attributes["integration_version"] == "2.3.4"
+
+        sensor = QubeInfoSensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+        assert sensor.extra_state_attributes["integration_version"] == "unknown"
+
+    async def test_info_sensor_writes_only_on_change(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test info sensor skips state writes when nothing changed."""
+        from custom_components.qube_heatpump.hub import QubeHub
+        from custom_components.qube_heatpump.sensor import QubeInfoSensor
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "qube1")
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        sensor = QubeInfoSensor(
+            coordinator=coordinator,
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        with patch.object(sensor, "async_write_ha_state") as write_state:
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 1
+
+            hub.inc_read_error()
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 2
+            assert sensor.extra_state_attributes["errors_read"] == 1
+
+            coordinator.last_update_success = False
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 3
+
+
 class TestQubeMetricSensorCountProviders:
-    """Tests for QubeMetricSensor count provider logic."""
+    """Tests for QubeMetricSensor count logic."""
 
     async def test_metric_sensor_count_sensors(self, hass: HomeAssistant) -> None:
-        """Test metric sensor returns sensor count from provider."""
+        """Test metric sensor returns sensor count from the hub."""
         from custom_components.qube_heatpump.sensor import QubeMetricSensor
 
         hub = MagicMock()
@@ -439,13 +581,10 @@ class TestQubeMetricSensorCountProviders:
         hub.unit = 1
         hub.label = "qube1"
         hub.entry_id = "test_entry"
-        hub.entities = []
+        hub.platform_counts = {"sensor": 10, "binary_sensor": 5, "switch": 3}
 
         coordinator = MagicMock()
 
-        def counts_provider():
-            return {"sensor": 10, "binary_sensor": 5, "switch": 3}
-
         sensor = QubeMetricSensor(
             coordinator=coordinator,
             hub=hub,
@@ -453,7 +592,6 @@ class TestQubeMetricSensorCountProviders:
             multi_device=False,
             version="1.0",
             kind="count_sensors",
-            counts_provider=counts_provider,
         )
 
         assert sensor.native_value == 10
@@ -461,7 +599,7 @@ class TestQubeMetricSensorCountProviders:
     async def test_metric_sensor_count_binary_sensors(
         self, hass: HomeAssistant
     ) -> None:
-        """Test metric sensor returns binary_sensor count from provider."""
+        """Test metric sensor returns binary_sensor count from the hub."""
         from custom_components.qube_heatpump.sensor import QubeMetricSensor
 
         hub = MagicMock()
@@ -469,13 +607,10 @@ class TestQubeMetricSensorCountProviders:
         hub.unit = 1
         hub.label = "qube1"
         hub.entry_id = "test_entry"
-        hub.entities = []
+        hub.platform_counts = {"sensor": 10, "binary_sensor": 5, "switch": 3}
 
         coordinator = MagicMock()
 
-        def counts_provider():
-            return {"sensor": 10, "binary_sensor": 5, "switch": 3}
-
         sensor = QubeMetricSensor(
             coordinator=coordinator,
             hub=hub,
@@ -483,13 +618,12 @@ class TestQubeMetricSensorCountProviders:
             multi_device=False,
             version="1.0",
             kind="count_binary_sensors",
-            counts_provider=counts_provider,
         )
 
         assert sensor.native_value == 5
 
     async def test_metric_sensor_count_switches(self, hass: HomeAssistant) -> None:
-        """Test metric sensor returns switch count from provider."""
+        """Test metric sensor returns switch count from the hub."""
         from custom_components.qube_heatpump.sensor import QubeMetricSensor
 
         hub = MagicMock()
@@ -497,13 +631,10 @@ class TestQubeMetricSensorCountProviders:
         hub.unit = 1
         hub.label = "qube1"
         hub.entry_id = "test_entry"
-        hub.entities = []
+        hub.platform_counts = {"sensor": 10, "binary_sensor": 5, "switch": 3}
 
         coordinator = MagicMock()
 
-        def counts_provider():
-            return {"sensor": 10, "binary_sensor": 5, "switch": 3}
-
         sensor = QubeMetricSensor(
             coordinator=coordinator,
             hub=hub,
@@ -511,11 +642,39 @@ class TestQubeMetricSensorCountProviders:
             multi_device=False,
             version="1.0",
             kind="count_switches",
-            counts_provider=counts_provider,
         )
 
         assert sensor.native_value == 3
 
+    async def test_metric_sensor_error_and_fallback_kinds(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test metric sensor error counters, count fallback and unknown kinds."""
+        from custom_components.qube_heatpump.hub import EntityDef, QubeHub
+        from custom_components.qube_heatpump.sensor import QubeMetricSensor
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "qube1")
+        hub.entities = [EntityDef(platform="switch", name="Enable", address=1)]
+        hub.inc_read_error()
+
+        def _metric(kind: str) -> QubeMetricSensor:
+            return QubeMetricSensor(
+                coordinator=MagicMock(),
+                hub=hub,
+                show_label=False,
+                multi_device=False,
+                version="1.0",
+                kind=kind,
+            )
+
+        read_errors = _metric("errors_read")
+        assert read_errors.native_value == 1
+        hub.inc_read_error()
+        assert read_errors.native_value == 2
+        assert _metric("errors_connect").native_value == 0
+        assert _metric("count_switches").native_value == 1
+        assert _metric("unknown").native_value is None
+
 
 class TestQubeSCOPSensorEdgeCases:
     """Tests for QubeSCOPSensor edge cases."""
@@ -535,11 +694,11 @@ class TestQubeSCOPSensorEdgeCases:
 
         electric_tracker = MagicMock()
         electric_tracker.tariffs = ["CH", "DHW"]
-        electric_tracker.get_total = MagicMock(return_value=0.0)
+        electric_tracker.total = 0.0
 
         thermic_tracker = MagicMock()
         thermic_tracker.tariffs = ["CH", "DHW"]
-        thermic_tracker.get_total = MagicMock(return_value=100.0)
+        thermic_tracker.total = 200.0
 
         sensor = QubeSCOPSensor(
             coordinator=coordinator,
@@ -572,12 +731,11 @@ class TestQubeSCOPSensorEdgeCases:
 
         electric_tracker = MagicMock()
         electric_tracker.tariffs = ["CH", "DHW"]
-        electric_tracker.get_total = MagicMock(return_value=1.0)
+        electric_tracker.total = 2.0
 
         thermic_tracker = MagicMock()
         thermic_tracker.tariffs = ["CH", "DHW"]
-        # SCOP of 20 exceeds max of 10
-        thermic_tracker.get_total = MagicMock(return_value=20.0)
+        thermic_tracker.total = 40.0
 
         sensor = QubeSCOPSensor(
             coordinator=coordinator,
@@ -593,7 +751,7 @@ class TestQubeSCOPSensorEdgeCases:
             version="1.0",
         )
 
-        # SCOP would be 40 (20/0.5 per tariff * 2 tariffs) which exceeds max
+        # SCOP of 20 exceeds max of 10
         assert sensor.native_value == 0.0
 
     async def test_scop_negative(self, hass: HomeAssistant) -> None:
@@ -611,11 +769,11 @@ class TestQubeSCOPSensorEdgeCases:
 
         electric_tracker = MagicMock()
         electric_tracker.tariffs = ["CH", "DHW"]
-        electric_tracker.get_total = MagicMock(return_value=10.0)
+        electric_tracker.total = 20.0
 
         thermic_tracker = MagicMock()
         thermic_tracker.tariffs = ["CH", "DHW"]
-        thermic_tracker.get_total = MagicMock(return_value=-5.0)
+        thermic_tracker.total = -10.0
 
         sensor = QubeSCOPSensor(
             coordinator=coordinator,
@@ -648,13 +806,11 @@ class TestQubeSCOPSensorEdgeCases:
 
         electric_tracker = MagicMock()
         electric_tracker.tariffs = ["CH", "DHW"]
-        # 5 + 5 = 10 total electric
-        electric_tracker.get_total = MagicMock(return_value=5.0)
+        electric_tracker.total = 10.0
 
         thermic_tracker = MagicMock()
         thermic_tracker.tariffs = ["CH", "DHW"]
-        # 15 + 15 = 30 total thermic
-        thermic_tracker.get_total = MagicMock(return_value=15.0)
+        thermic_tracker.total = 30.0
 
         sensor = QubeSCOPSensor(
             coordinator=coordinator,
@@ -715,6 +871,89 @@ class TestQubeSCOPSensorEdgeCases:
         # SCOP = 20/5 = 4.0
         assert sensor.native_value == 4.0
 
+    async def test_scop_reuses_result_for_unchanged_totals(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test SCOP is only recomputed when a tracker total changes."""
+        from custom_components.qube_heatpump.sensor import QubeSCOPSensor
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        hub.entry_id = "test_entry"
+
+        electric_tracker = MagicMock()
+        electric_tracker.get_total = MagicMock(return_value=5.0)
+        thermic_tracker = MagicMock()
+        thermic_tracker.get_total = MagicMock(return_value=20.0)
+
+        sensor = QubeSCOPSensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            electric_tracker=electric_tracker,
+            thermic_tracker=thermic_tracker,
+            scope="CH",
+            translation_key="scop_ch_month",
+            unique_base="qube_scop_ch_monthly",
+            object_base="scop_ch_month",
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        assert sensor.native_value == 4.0
+        assert sensor._scop_cache == (5.0, 20.0, 4.0)
+        assert sensor.native_value == 4.0
+
+        thermic_tracker.get_total.return_value = 25.0
+        assert sensor.native_value == 5.0
+
+        electric_tracker.get_total.return_value = 1.0
+        assert sensor.native_value == 0.0
+
+    async def test_scop_update_leaves_trackers_alone(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test the SCOP sensor never feeds the shared trackers itself."""
+        from custom_components.qube_heatpump.sensor import QubeSCOPSensor
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        hub.entry_id = "test_entry"
+
+        coordinator = MagicMock()
+        coordinator.data = {"energy": 1.0}
+
+        electric_tracker = MagicMock()
+        electric_tracker.tariffs = ["CH", "DHW"]
+        thermic_tracker = MagicMock()
+        thermic_tracker.tariffs = ["CH", "DHW"]
+
+        sensor = QubeSCOPSensor(
+            coordinator=coordinator,
+            hub=hub,
+            electric_tracker=electric_tracker,
+            thermic_tracker=thermic_tracker,
+            scope="total",
+            translation_key="scop_month",
+            unique_base="qube_scop_monthly",
+            object_base="scop_maand",
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        with patch.object(sensor, "async_write_ha_state") as write_state:
+            sensor._handle_coordinator_update()
+            coordinator.data = {"energy": 2.0}
+            sensor._handle_coordinator_update()
+            electric_tracker.update.assert_not_called()
+            thermic_tracker.update.assert_not_called()
+            assert write_state.call_count == 2
+
 
 class TestQubeComputedSensorStatusMappings:
     """Tests for QubeComputedSensor status mappings."""
@@ -722,10 +961,7 @@ class TestQubeComputedSensorStatusMappings:
     async def test_computed_sensor_status_standby(self, hass: HomeAssistant) -> None:
         """Test computed sensor returns standby for codes 1, 14, 18."""
         from custom_components.qube_heatpump.hub import EntityDef
-        from custom_components.qube_heatpump.sensor import (
-            QubeComputedSensor,
-            _entity_key,
-        )
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
         hub = MagicMock()
         hub.host = "1.2.3.4"
@@ -742,7 +978,7 @@ class TestQubeComputedSensorStatusMappings:
 
         for code in [1, 14, 18]:
             coordinator = MagicMock()
-            coordinator.data = {_entity_key(source): code}
+            coordinator.data = {source.data_key: code}
 
             sensor = QubeComputedSensor(
                 coordinator=coordinator,
@@ -761,10 +997,7 @@ class TestQubeComputedSensorStatusMappings:
     async def test_computed_sensor_status_mappings(self, hass: HomeAssistant) -> None:
         """Test computed sensor status code mappings."""
         from custom_components.qube_heatpump.hub import EntityDef
-        from custom_components.qube_heatpump.sensor import (
-            QubeComputedSensor,
-            _entity_key,
-        )
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
         hub = MagicMock()
         hub.host = "1.2.3.4"
@@ -793,7 +1026,7 @@ class TestQubeComputedSensorStatusMappings:
 
         for code, expected in mappings.items():
             coordinator = MagicMock()
-            coordinator.data = {_entity_key(source): code}
+            coordinator.data = {source.data_key: code}
 
             sensor = QubeComputedSensor(
                 coordinator=coordinator,
@@ -814,10 +1047,7 @@ class TestQubeComputedSensorStatusMappings:
     ) -> None:
         """req_antileg_1 overrides the status code, except when ALARM."""
         from custom_components.qube_heatpump.hub import EntityDef
-        from custom_components.qube_heatpump.sensor import (
-            QubeComputedSensor,
-            _entity_key,
-        )
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
         hub = MagicMock()
         hub.host = "1.2.3.4"
@@ -844,7 +1074,7 @@ class TestQubeComputedSensorStatusMappings:
         for code, antileg, expected in cases:
             coordinator = MagicMock()
             coordinator.data = {
-                _entity_key(source): code,
+                source.data_key: code,
                 "req_antileg_1": antileg,
             }
 
@@ -867,10 +1097,7 @@ class TestQubeComputedSensorStatusMappings:
     async def test_computed_sensor_drieweg(self, hass: HomeAssistant) -> None:
         """Test computed sensor drieweg (3-way valve) mapping."""
         from custom_components.qube_heatpump.hub import EntityDef
-        from custom_components.qube_heatpump.sensor import (
-            QubeComputedSensor,
-            _entity_key,
-        )
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
         hub = MagicMock()
         hub.host = "1.2.3.4"
@@ -887,7 +1114,7 @@ class TestQubeComputedSensorStatusMappings:
 
         # DHW when True
         coordinator = MagicMock()
-        coordinator.data = {_entity_key(source): True}
+        coordinator.data = {source.data_key: True}
 
         sensor = QubeComputedSensor(
             coordinator=coordinator,
@@ -904,16 +1131,13 @@ class TestQubeComputedSensorStatusMappings:
         assert sensor.native_value == "dhw"
 
         # CH when False
-        coordinator.data = {_entity_key(source): False}
+        coordinator.data = {source.data_key: False}
         assert sensor.native_value == "ch"
 
     async def test_computed_sensor_vierweg(self, hass: HomeAssistant) -> None:
         """Test computed sensor vierweg (4-way valve) mapping."""
         from custom_components.qube_heatpump.hub import EntityDef
-        from custom_components.qube_heatpump.sensor import (
-            QubeComputedSensor,
-            _entity_key,
-        )
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
         hub = MagicMock()
         hub.host = "1.2.3.4"
@@ -930,7 +1154,7 @@ class TestQubeComputedSensorStatusMappings:
 
         # Heating when True
         coordinator = MagicMock()
-        coordinator.data = {_entity_key(source): True}
+        coordinator.data = {source.data_key: True}
 
         sensor = QubeComputedSensor(
             coordinator=coordinator,
@@ -947,11 +1171,66 @@ class TestQubeComputedSensorStatusMappings:
         assert sensor.native_value == "heating"
 
         # Cooling when False
-        coordinator.data = {_entity_key(source): False}
+        coordinator.data = {source.data_key: False}
         assert sensor.native_value == "cooling"
 
+    async def test_computed_sensor_writes_only_on_change(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test computed sensor skips state writes while its source is unchanged."""
+        from custom_components.qube_heatpump.hub import EntityDef
+        from custom_components.qube_heatpump.sensor import QubeComputedSensor
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        hub.entry_id = "test_entry"
+
+        source = EntityDef(
+            platform="binary_sensor",
+            name="Drieweg",
+            address=4,
+            unique_id="test_drieweg",
+        )
+
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        coordinator.data = {source.data_key: True, "other": 1}
+
+        sensor = QubeComputedSensor(
+            coordinator=coordinator,
+            hub=hub,
+            translation_key="drieweg_status",
+            unique_suffix="driewegklep_dhw_cv",
+            kind="drieweg",
+            source=source,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        with patch.object(sensor, "async_write_ha_state") as write_state:
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 1
+
+            # Unrelated value changed: no write
+            coordinator.data = {source.data_key: True, "other": 2}
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 1
+
+            coordinator.data = {source.data_key: False, "other": 2}
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 2
+
+            coordinator.last_update_success = False
+            sensor._handle_coordinator_update()
+            assert write_state.call_count == 3
+
     async def test_computed_sensor_none_value(self, hass: HomeAssistant) -> None:
-        """Test computed sensor returns None when source value is None."""
+        """Test computed sensor returns None for missing or non-numeric values."""
+        from python_qube_heatpump import resolve_status
+
         from custom_components.qube_heatpump.hub import EntityDef
         from custom_components.qube_heatpump.sensor import QubeComputedSensor
 
@@ -985,6 +1264,12 @@ class TestQubeComputedSensorStatusMappings:
 
         assert sensor.native_value is None
 
+        coordinator.data = {"test_status": "not-a-number"}
+        assert sensor.native_value is None
+
+        coordinator.data = {"test_status": 16.0}
+        assert sensor.native_value == resolve_status(16, None).value
+
 
 class TestQubeStandbyEnergySensorRestore:
     """Tests for QubeStandbyEnergySensor state restoration."""
@@ -998,6 +1283,136 @@ class TestQubeStandbyEnergySensorRestore:
             value = 0.0
         assert value == 0.0
 
+    async def test_standby_energy_restores_native_value(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test standby energy is restored from the stored native value."""
+        from custom_components.qube_heatpump.sensor import QubeStandbyEnergySensor
+        from homeassistant.components.sensor import SensorExtraStoredData
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        sensor = QubeStandbyEnergySensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+        last_state = MagicMock()
+        last_state.last_changed = dt_util.utcnow() - timedelta(hours=1)
+        with (
+            patch(
+                "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass"
+            ),
+            patch.object(
+                sensor,
+                "async_get_last_sensor_data",
+                return_value=SensorExtraStoredData(1.25, "kWh"),
+            ),
+            patch.object(sensor, "async_get_last_state", return_value=last_state),
+        ):
+            await sensor.async_added_to_hass()
+
+        assert sensor._energy_kwh == 1.25
+        # One hour of downtime at 17 W adds 0.017 kWh
+        sensor._integrate()
+        assert sensor._energy_kwh == pytest.approx(1.267, abs=1e-4)
+
+    async def test_standby_energy_restores_legacy_state(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test standby energy falls back to the state without stored data."""
+        from custom_components.qube_heatpump.sensor import QubeStandbyEnergySensor
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        sensor = QubeStandbyEnergySensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+        last_state = MagicMock()
+        last_state.state = "2.5"
+        last_state.last_changed = dt_util.utcnow()
+        with (
+            patch(
+                "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass"
+            ),
+            patch.object(sensor, "async_get_last_sensor_data", return_value=None),
+            patch.object(sensor, "async_get_last_state", return_value=last_state),
+        ):
+            await sensor.async_added_to_hass()
+
+        assert sensor._energy_kwh == pytest.approx(2.5, abs=1e-4)
+
+        # Nothing to restore from an unknown state
+        sensor._energy_kwh = 0.0
+        last_state.state = "unknown"
+        with (
+            patch(
+                "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass"
+            ),
+            patch.object(sensor, "async_get_last_sensor_data", return_value=None),
+            patch.object(sensor, "async_get_last_state", return_value=last_state),
+        ):
+            await sensor.async_added_to_hass()
+
+        assert sensor._energy_kwh == 0.0
+
+
+class TestQubeTariffEnergySensorRestore:
+    """Tests for QubeTariffEnergySensor state restoration."""
+
+    async def test_tariff_energy_restores_legacy_state(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test tariff energy falls back to the state without stored data."""
+        from custom_components.qube_heatpump.sensor import (
+            QubeTariffEnergySensor,
+            TariffEnergyTracker,
+        )
+
+        hub = MagicMock()
+        hub.host = "1.2.3.4"
+        hub.unit = 1
+        hub.label = "qube1"
+        tracker = TariffEnergyTracker(
+            base_key="energy", binary_key="tariff", tariffs=["CH", "DHW"]
+        )
+        sensor = QubeTariffEnergySensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            tracker=tracker,
+            tariff="CH",
+            translation_key="energy_electric_ch",
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+        last_state = MagicMock(spec=["state", "attributes"])
+        cycle_start = tracker.last_reset + timedelta(days=1)
+        last_state.state = "12.5"
+        last_state.attributes = {"cycle_start": cycle_start.isoformat()}
+        with (
+            patch(
+                "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass"
+            ),
+            patch.object(sensor, "async_get_last_sensor_data", return_value=None),
+            patch.object(sensor, "async_get_last_state", return_value=last_state),
+        ):
+            await sensor.async_added_to_hass()
+
+        assert tracker.get_total("CH") == 12.5
+        assert tracker.total == 12.5
+        assert tracker.last_reset == cycle_start
+
 
 class TestQubeTotalEnergyWithStandby:
     """Tests for QubeTotalEnergyIncludingStandbySensor."""
@@ -1022,6 +1437,62 @@ class TestQubeTotalEnergyWithStandby:
         assert base_float is None
 
 
+class TestQubeStandbyPowerSensor:
+    """Tests for QubeStandbyPowerSensor."""
+
+    async def test_standby_power_is_constant(self, hass: HomeAssistant) -> None:
+        """Test standby power reports a constant value."""
+        from custom_components.qube_heatpump.hub import QubeHub
+        from custom_components.qube_heatpump.sensor import (
+            STANDBY_POWER_WATTS,
+            QubeStandbyPowerSensor,
+        )
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "Qube Heat Pump")
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        sensor = QubeStandbyPowerSensor(
+            coordinator=coordinator,
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        assert sensor.native_value == STANDBY_POWER_WATTS
+        assert sensor.unique_id == "1.2.3.4_1_power_standby"
+        assert sensor.device_info is hub.get_device_info("1.0")
+
+    async def test_standby_power_follows_coordinator_availability(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test standby power goes unavailable with the coordinator."""
+        from custom_components.qube_heatpump.hub import QubeHub
+        from custom_components.qube_heatpump.sensor import QubeStandbyPowerSensor
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "Qube Heat Pump")
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        sensor = QubeStandbyPowerSensor(
+            coordinator=coordinator,
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        with patch.object(sensor, "async_write_ha_state") as write_state:
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+            assert sensor.available is True
+            assert write_state.call_count == 1
+
+            coordinator.last_update_success = False
+            sensor._handle_coordinator_update()
+            assert sensor.available is False
+            assert write_state.call_count == 2
+
+
 class TestQubeIPAddressSensorDeviceClass:
     """Tests for QubeIPAddressSensor device class handling."""
 
@@ -1051,3 +1522,21 @@ class TestQubeIPAddressSensorDeviceClass:
 
         # Should still work even if IP device class doesn't exist
         assert sensor.native_value == "1.2.3.4"
+
+    async def test_ip_sensor_device_info_shared(self, hass: HomeAssistant) -> None:
+        """Test IP sensor uses the device info shared through the hub."""
+        from custom_components.qube_heatpump.hub import QubeHub
+        from custom_components.qube_heatpump.sensor import QubeIPAddressSensor
+
+        hub = QubeHub(hass, "1.2.3.4", 502, "test_entry", 1, "Qube Heat Pump")
+        sensor = QubeIPAddressSensor(
+            coordinator=MagicMock(),
+            hub=hub,
+            show_label=False,
+            multi_device=False,
+            version="1.0",
+        )
+
+        info = sensor.device_info
+        assert info["identifiers"] == {(DOMAIN, "1.2.3.4:1")}
+        assert info is hub.get_device_info("1.0")